@@ -54,16 +54,33 @@ class AnthropicAnalyzer(SubconsciousAnalyzer):
         # Read the recording text
         recording_text = self._read_recording(recording_path)
 
+        # Extract session ID from recording filename
+        session_id = recording_path.stem.replace('parsed_', '')
+
+        return self.analyze_text(recording_text, session_id=session_id)
+
+    def analyze_text(self, text: str, session_id: str = 'unknown') -> AnalysisResult:
+        """
+        Analyze recording text already held in memory.
+
+        Args:
+            text: Parsed terminal recording text
+            session_id: Session identifier used to name saved raw output
+
+        Returns:
+            AnalysisResult with extracted insights
+
+        Raises:
+            RuntimeError: If API call fails
+        """
         # Read the analysis prompt
         system_prompt = self._read_prompt()
 
         # Call Anthropic API
-        raw_output = self._call_anthropic_api(system_prompt, recording_text)
+        raw_output = self._call_anthropic_api(system_prompt, text)
 
         # Save raw output if output directory is configured
         if self.output_dir:
-            # Extract session ID from recording filename
-            session_id = recording_path.stem.replace('parsed_', '')
             output_file = self.output_dir / f'analysis_{session_id}.md'
             output_file.write_text(raw_output)
 
@@ -6,6 +6,8 @@ Uses Claude Code CLI in headless mode to analyze terminal recordings.
 """
 
 import subprocess
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -30,6 +32,10 @@ class ClaudeAnalyzer(SubconsciousAnalyzer):
         if output_dir:
             output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Seconds from invocation to the first output byte of the most
+        # recent analysis (None until an analysis has run)
+        self.last_first_token_latency = None
+
     def analyze(self, recording_path: Path) -> AnalysisResult:
         """
         Analyze a terminal recording using Claude.
@@ -47,13 +53,30 @@ class ClaudeAnalyzer(SubconsciousAnalyzer):
         # Read the recording text
         recording_text = self._read_recording(recording_path)
 
+        # Extract session ID from recording filename (e.g., parsed_20260204_092751.txt)
+        session_id = recording_path.stem.replace('parsed_', '')
+
+        return self.analyze_text(recording_text, session_id=session_id)
+
+    def analyze_text(self, text: str, session_id: str = 'unknown') -> AnalysisResult:
+        """
+        Analyze recording text already held in memory.
+
+        Args:
+            text: Parsed terminal recording text
+            session_id: Session identifier used to name saved raw output
+
+        Returns:
+            AnalysisResult with extracted insights
+
+        Raises:
+            RuntimeError: If Claude invocation fails
+        """
         # Invoke Claude in headless mode
-        raw_output = self._invoke_claude(recording_text)
+        raw_output = self._invoke_claude(text)
 
         # Save raw output if output directory is configured
         if self.output_dir:
-            # Extract session ID from recording filename (e.g., parsed_20260204_092751.txt)
-            session_id = recording_path.stem.replace('parsed_', '')
             output_file = self.output_dir / f'analysis_{session_id}.md'
             output_file.write_text(raw_output)
 
@@ -64,7 +87,12 @@ class ClaudeAnalyzer(SubconsciousAnalyzer):
 
     def _invoke_claude(self, recording_text: str) -> str:
         """
-        Invoke Claude Code CLI in headless mode.
+        Invoke Claude Code CLI in headless mode, streaming its output.
+
+        Output is consumed incrementally as the CLI produces it rather
+        than blocking on a single buffered read, so receive overlaps with
+        generation and first-token latency can be measured. Deltas are
+        accumulated in a list and joined once at the end.
 
         Args:
             recording_text: The terminal recording text to analyze
@@ -86,34 +114,88 @@ class ClaudeAnalyzer(SubconsciousAnalyzer):
         ]
 
         try:
-            # Run Claude with recording as stdin
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                input=recording_text,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-                check=True
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+        except FileNotFoundError:
+            raise RuntimeError(
+                "Claude CLI not found. Is it installed and in PATH?"
             )
 
-            return result.stdout
-
-        except subprocess.TimeoutExpired:
+        # 5 minute timeout, enforced by killing the process
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(300, _kill)
+        timer.start()
+
+        # Feed stdin from a separate thread so a full stdin pipe can't
+        # deadlock against our stdout reads
+        def _feed():
+            try:
+                proc.stdin.write(recording_text)
+                proc.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+
+        feeder = threading.Thread(target=_feed, daemon=True)
+
+        # Drain stderr concurrently for the same reason: a CLI that fills
+        # its stderr pipe before closing stdout would otherwise block
+        # while we block on stdout, and the stall would be misreported as
+        # a timeout with the real diagnostics discarded
+        stderr_chunks = []
+
+        def _drain_stderr():
+            try:
+                stderr_chunks.append(proc.stderr.read())
+            except (ValueError, OSError):
+                pass
+
+        drainer = threading.Thread(target=_drain_stderr, daemon=True)
+        start = time.monotonic()
+        feeder.start()
+        drainer.start()
+
+        deltas = []
+        first_token_latency = None
+        try:
+            while True:
+                delta = proc.stdout.read(8192)
+                if not delta:
+                    break
+                if first_token_latency is None:
+                    first_token_latency = time.monotonic() - start
+                deltas.append(delta)
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            feeder.join()
+            drainer.join()
+        stderr = "".join(stderr_chunks)
+
+        self.last_first_token_latency = first_token_latency
+
+        if timed_out.is_set():
             raise RuntimeError("Claude analysis timed out after 5 minutes")
 
-        except subprocess.CalledProcessError as e:
+        if returncode != 0:
             error_msg = (
-                f"Claude invocation failed with exit code {e.returncode}\n"
+                f"Claude invocation failed with exit code {returncode}\n"
                 f"Command: {' '.join(cmd)}\n"
-                f"STDOUT:\n{e.stdout}\n"
-                f"STDERR:\n{e.stderr}"
+                f"STDOUT:\n{''.join(deltas)}\n"
+                f"STDERR:\n{stderr}"
             )
             raise RuntimeError(error_msg)
 
-        except FileNotFoundError:
-            raise RuntimeError(
-                "Claude CLI not found. Is it installed and in PATH?"
-            )
+        return "".join(deltas)
 
 
 def create_analyzer(prompt_path: Path, output_dir: Optional[Path] = None) -> ClaudeAnalyzer:
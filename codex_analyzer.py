@@ -67,11 +67,27 @@ class CodexAnalyzer(SubconsciousAnalyzer):
             FileNotFoundError: If recording file doesn't exist
         """
         recording_text = self._read_recording(recording_path)
+        session_id = recording_path.stem.replace('parsed_', '')
+        return self.analyze_text(recording_text, session_id=session_id)
+
+    def analyze_text(self, text: str, session_id: str = 'unknown') -> AnalysisResult:
+        """
+        Analyze recording text already held in memory.
+
+        Args:
+            text: Parsed terminal recording text
+            session_id: Session identifier used to name saved raw output
+
+        Returns:
+            AnalysisResult with extracted insights
+
+        Raises:
+            RuntimeError: If Codex invocation fails
+        """
         system_prompt = self._read_prompt()
-        raw_output = self._invoke_codex(system_prompt, recording_text)
+        raw_output = self._invoke_codex(system_prompt, text)
 
         if self.output_dir:
-            session_id = recording_path.stem.replace('parsed_', '')
             output_file = self.output_dir / f'analysis_{session_id}.md'
             output_file.write_text(raw_output)
 
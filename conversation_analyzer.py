@@ -23,6 +23,9 @@ class AnalysisResult:
     preferences: List[str] = field(default_factory=list)
     learnings: List[str] = field(default_factory=list)
     summary: Optional[str] = None
+    # Unparsed LLM output this result came from - lets callers combine or
+    # archive raw analyses without re-reading them from disk
+    raw_output: Optional[str] = None
 
     def is_empty(self) -> bool:
         """Check if analysis found anything."""
@@ -126,12 +129,19 @@ class AnalysisParser:
 
         Handles both markdown-formatted output and JSON output.
         """
-        # Try JSON first (if agent supports it)
-        if raw_output.strip().startswith('{'):
-            return AnalysisParser._parse_json(raw_output)
-
-        # Otherwise parse as markdown
-        return AnalysisParser._parse_markdown(raw_output)
+        # Try JSON first (if agent supports it). Only bother when the
+        # tail looks complete - a truncated stream can't parse, so the
+        # O(n) json.loads attempt would be wasted before the markdown
+        # fallback runs anyway.
+        stripped = raw_output.strip()
+        if stripped.startswith('{') and stripped[-1:] in ('}', ']'):
+            result = AnalysisParser._parse_json(raw_output)
+        else:
+            # Otherwise parse as markdown
+            result = AnalysisParser._parse_markdown(raw_output)
+
+        result.raw_output = raw_output
+        return result
 
     @staticmethod
     def _parse_json(json_output: str) -> AnalysisResult:
@@ -288,6 +298,9 @@ class SubconsciousAnalyzer(ABC):
         self.prompt_path = prompt_path
         if not prompt_path.exists():
             raise FileNotFoundError(f"Analysis prompt not found: {prompt_path}")
+        # The prompt is identical for every analyze call this instance
+        # makes; read it once here instead of once per chunk
+        self._prompt_text = prompt_path.read_text()
 
     @abstractmethod
     def analyze(self, recording_path: Path) -> AnalysisResult:
@@ -302,9 +315,26 @@ class SubconsciousAnalyzer(ABC):
         """
         pass
 
+    @abstractmethod
+    def analyze_text(self, text: str, session_id: str = 'unknown') -> AnalysisResult:
+        """
+        Analyze recording text already held in memory.
+
+        Avoids the write/re-read round-trip through a parsed file when the
+        caller already has the conversation text.
+
+        Args:
+            text: Parsed terminal recording text
+            session_id: Session identifier used to name saved raw output
+
+        Returns:
+            AnalysisResult with extracted insights
+        """
+        pass
+
     def _read_prompt(self) -> str:
-        """Read the analysis prompt from file."""
-        return self.prompt_path.read_text()
+        """Return the analysis prompt (cached at construction)."""
+        return self._prompt_text
 
     def _read_recording(self, recording_path: Path) -> str:
         """Read the terminal recording text."""
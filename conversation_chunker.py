@@ -51,7 +51,8 @@ class ConversationChunker:
 
         Args:
             text: Full conversation text
-            strategy: Chunking strategy ('natural', 'fixed', 'sentences')
+            strategy: Chunking strategy ('natural', 'fixed', 'sentences',
+                'sliding')
 
         Returns:
             List of Chunk objects
@@ -73,6 +74,8 @@ class ConversationChunker:
             return self._chunk_fixed_size(text)
         elif strategy == 'sentences':
             return self._chunk_sentences(text)
+        elif strategy == 'sliding':
+            return self._chunk_sliding(text)
         else:
             raise ValueError(f"Unknown chunking strategy: {strategy}")
 
@@ -256,6 +259,43 @@ class ConversationChunker:
 
         return chunks
 
+    def _chunk_sliding(self, text: str) -> List[Chunk]:
+        """
+        Sliding window chunking with a fixed overlap between windows.
+
+        Consecutive windows share target_size // 10 characters, so the
+        text itself carries cross-boundary context - no summarization
+        pass or context prepend is needed, and windows can be analyzed
+        independently. Downstream dedup absorbs findings repeated in the
+        overlap.
+        """
+        overlap = self.target_size // 10
+        step = max(self.target_size - overlap, self.min_size)
+
+        chunks = []
+        start = 0
+        text_length = len(text)
+
+        while start < text_length:
+            end = min(start + self.target_size, text_length)
+            chunks.append(Chunk(
+                text=text[start:end],
+                start_char=start,
+                end_char=end,
+                chunk_index=len(chunks),
+                total_chunks=0,  # Will update after
+                boundary_reason='sliding_window'
+            ))
+            if end >= text_length:
+                break
+            start += step
+
+        # Update total_chunks
+        for chunk in chunks:
+            chunk.total_chunks = len(chunks)
+
+        return chunks
+
     def _chunk_sentences(self, text: str) -> List[Chunk]:
         """Chunk on sentence boundaries (more conservative)."""
         # Simple sentence detection
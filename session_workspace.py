@@ -7,10 +7,56 @@ concurrent sessions and workers.
 """
 
 import json
+import mmap
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+# (path -> (st_mtime_ns, value)) cache for _read_status_field - an
+# unchanged status file is answered without re-reading it
+_status_field_cache = {}
+
+
+@dataclass(frozen=True)
+class CerebrumLayout:
+    """
+    Precomputed paths under a cerebrum root.
+
+    Every / on a Path allocates a new object, and the
+    '.ai/subconscious/.ai' prefix gets rebuilt all over the codebase.
+    One layout per cerebrum (see get_cerebrum_layout) computes each
+    derived path exactly once.
+    """
+
+    root: Path
+    subconscious: Path
+    transcripts_dir: Path
+    recordings_dir: Path
+    sessions_dir: Path
+    processed_dir: Path
+    short_term_memory: Path
+    guidance_file: Path
+
+
+@lru_cache(maxsize=8)
+def get_cerebrum_layout(cerebrum_path: Path) -> CerebrumLayout:
+    """Return the (cached) CerebrumLayout for a cerebrum root."""
+    root = Path(cerebrum_path)
+    subconscious = root / '.ai' / 'subconscious' / '.ai'
+    return CerebrumLayout(
+        root=root,
+        subconscious=subconscious,
+        transcripts_dir=subconscious / 'transcripts',
+        recordings_dir=subconscious / 'recordings',
+        sessions_dir=subconscious / 'sessions',
+        processed_dir=subconscious / 'processed',
+        short_term_memory=root / '.ai' / 'short-term-memory',
+        guidance_file=subconscious / 'guidance.md',
+    )
+
 
 class SessionWorkspace:
     """
@@ -28,19 +74,23 @@ class SessionWorkspace:
             └── processing.log       # Session-specific log
     """
 
-    def __init__(self, session_id: str, cerebrum_path: Path):
+    def __init__(self, session_id: str, cerebrum_path: Path,
+                 layout: Optional[CerebrumLayout] = None):
         """
         Initialize session workspace.
 
         Args:
             session_id: Unique session identifier (YYYYMMDD_HHMMSS)
             cerebrum_path: Path to cerebrum root
+            layout: Optional precomputed CerebrumLayout (defaults to the
+                cached layout for cerebrum_path)
         """
         self.session_id = session_id
         self.cerebrum_path = cerebrum_path
+        self.layout = layout if layout is not None else get_cerebrum_layout(cerebrum_path)
 
         # Session workspace root
-        self.root = cerebrum_path / '.ai' / 'subconscious' / '.ai' / 'sessions' / session_id
+        self.root = self.layout.sessions_dir / session_id
 
         # Subdirectories
         self.analyses_dir = self.root / 'analyses'
@@ -53,14 +103,28 @@ class SessionWorkspace:
         self.manifest_file = self.root / 'manifest.json'
         self.guidance_file = self.root / 'guidance.md'
         self.log_file = self.root / 'processing.log'
+        self.chunks_log_file = self.root / 'chunks.log'
+
+        # Lazily-opened persistent log handle (see log())
+        self._log_fp = None
+
+        # In-memory chunk manifest cache. manifest.json holds the initial
+        # descriptor; status updates mutate the cache and append deltas to
+        # chunks.log (sequential writes, no manifest rewrite). Inside a
+        # batch() block deltas accumulate and land in one write on exit.
+        self._manifest_cache = None
+        self._pending_deltas = []
+        self._batch_depth = 0
+        self._chunks_log_fd = None
 
     def create(self):
         """Create workspace directory structure."""
-        self.root.mkdir(parents=True, exist_ok=True)
-        self.analyses_dir.mkdir(exist_ok=True)
-        self.parsed_dir.mkdir(exist_ok=True)
-        self.memories_dir.mkdir(exist_ok=True)
-        self.procedural_dir.mkdir(exist_ok=True)
+        # Each leaf makedirs creates the root implicitly on the first
+        # call; the remaining leaves are a single mkdirat each instead of
+        # a parents walk per directory
+        for leaf in (self.analyses_dir, self.parsed_dir,
+                     self.memories_dir, self.procedural_dir):
+            os.makedirs(leaf, exist_ok=True)
 
         # Initialize status
         self.update_status('processing', {
@@ -85,8 +149,18 @@ class SessionWorkspace:
         if metadata:
             status_data.update(metadata)
 
-        with open(self.status_file, 'w') as f:
-            json.dump(status_data, f, indent=2)
+        # Serialize once and write through a raw fd - one open/write/close
+        # without the text-layer buffering setup
+        data = json.dumps(status_data, indent=2).encode('utf-8')
+        fd = os.open(
+            self.status_file,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0),
+            0o644
+        )
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
 
     def get_status(self) -> Dict[str, Any]:
         """Get current session status."""
@@ -118,61 +192,168 @@ class SessionWorkspace:
                 'created_at': datetime.now().isoformat()
             }
 
-        with open(self.manifest_file, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        self._manifest_cache = manifest
+        self._flush_manifest()
 
     def update_chunk_status(self, chunk_num: int, status: str, metadata: Optional[Dict[str, Any]] = None):
         """
         Update chunk processing status.
 
+        Mutates the in-memory manifest and appends a delta line to
+        chunks.log - a sequential append instead of a full manifest
+        rewrite per update. Inside a batch() block the deltas accumulate
+        and land in a single write on exit.
+
         Args:
             chunk_num: Chunk number (1-indexed)
             status: One of: pending, processing, complete, failed
             metadata: Optional additional metadata (error message, worker_pid, etc.)
         """
-        if not self.manifest_file.exists():
-            return
+        if self._manifest_cache is None:
+            if not self.manifest_file.exists():
+                return
+            self.get_chunk_manifest()
 
-        with open(self.manifest_file) as f:
-            manifest = json.load(f)
+        delta = {
+            'chunk': chunk_num,
+            'status': status,
+            'updated_at': datetime.now().isoformat()
+        }
+        if metadata:
+            delta.update(metadata)
 
-        chunk_key = str(chunk_num)
+        self._apply_delta(self._manifest_cache, delta)
+        self._pending_deltas.append(json.dumps(delta) + '\n')
+        if self._batch_depth == 0:
+            self._append_deltas()
+
+    @staticmethod
+    def _apply_delta(manifest: Dict[str, Any], delta: Dict[str, Any]):
+        """Fold one chunks.log delta into a manifest dict."""
+        chunk_key = str(delta['chunk'])
         if chunk_key not in manifest['chunks']:
             manifest['chunks'][chunk_key] = {'attempts': 0}
+        entry = dict(delta)
+        del entry['chunk']
+        manifest['chunks'][chunk_key].update(entry)
 
-        manifest['chunks'][chunk_key].update({
-            'status': status,
-            'updated_at': datetime.now().isoformat()
-        })
+    def _append_deltas(self):
+        """Write pending delta lines to chunks.log in one append."""
+        if not self._pending_deltas:
+            return
+        if self._chunks_log_fd is None:
+            self._chunks_log_fd = os.open(
+                self.chunks_log_file,
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_CLOEXEC', 0),
+                0o644
+            )
+        os.write(self._chunks_log_fd, ''.join(self._pending_deltas).encode('utf-8'))
+        self._pending_deltas = []
+
+    def batch_update(self, updates):
+        """
+        Apply several chunk-status updates with a single manifest write.
 
-        if metadata:
-            manifest['chunks'][chunk_key].update(metadata)
+        Args:
+            updates: Iterable of (chunk_num, status) or
+                (chunk_num, status, metadata) tuples
+        """
+        with self.batch():
+            for update in updates:
+                self.update_chunk_status(*update)
 
-        with open(self.manifest_file, 'w') as f:
-            json.dump(manifest, f, indent=2)
+    def batch(self) -> 'SessionWorkspace':
+        """
+        Context manager that coalesces chunk-status writes.
+
+        Inside the block, update_chunk_status only mutates the cached
+        manifest; the accumulated chunks.log deltas land in one append
+        on exit.
+        """
+        return self
+
+    def __enter__(self) -> 'SessionWorkspace':
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._append_deltas()
+        return False
+
+    def _flush_manifest(self):
+        """Write the cached manifest to disk atomically."""
+        tmp_file = self.manifest_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(self._manifest_cache, f, indent=2)
+        os.replace(tmp_file, self.manifest_file)
+
+    def compact(self):
+        """
+        Collapse chunks.log back into manifest.json.
+
+        Called when processing finishes so long-lived sessions don't
+        leave an ever-growing delta log behind.
+        """
+        if self._manifest_cache is None and not self.chunks_log_file.exists():
+            return
+        self.get_chunk_manifest()
+        if self._manifest_cache is None:
+            return
+        self._append_deltas()
+        self._flush_manifest()
+        if self._chunks_log_fd is not None:
+            os.close(self._chunks_log_fd)
+            self._chunks_log_fd = None
+        try:
+            self.chunks_log_file.unlink()
+        except OSError:
+            pass
 
     def get_chunk_manifest(self) -> Dict[str, Any]:
-        """Get current chunk manifest."""
+        """
+        Get current chunk manifest.
+
+        Loads manifest.json and folds any chunks.log deltas over it, so
+        callers always see the append-only log already applied.
+        """
+        if self._manifest_cache is not None:
+            return self._manifest_cache
+
         if not self.manifest_file.exists():
             return {'chunks': {}}
 
         with open(self.manifest_file) as f:
-            return json.load(f)
+            manifest = json.load(f)
+
+        if self.chunks_log_file.exists():
+            with open(self.chunks_log_file) as f:
+                for line in f:
+                    if line.strip():
+                        self._apply_delta(manifest, json.loads(line))
+
+        self._manifest_cache = manifest
+        return self._manifest_cache
 
     def log(self, message: str):
         """
         Append message to session log.
 
+        The log handle is opened once and kept line-buffered, so each call
+        is a single buffered write instead of an open/write/close cycle.
+
         Args:
             message: Log message
         """
-        with open(self.log_file, 'a') as f:
-            timestamp = datetime.now().isoformat()
-            f.write(f"{timestamp} {message}\n")
-            f.flush()
+        if self._log_fp is None or self._log_fp.closed:
+            self._log_fp = open(self.log_file, 'a', buffering=1)
+        timestamp = datetime.now().isoformat()
+        self._log_fp.write(f"{timestamp} {message}\n")
 
     def mark_complete(self, metadata: Optional[Dict[str, Any]] = None):
         """Mark session processing as complete."""
+        self.compact()
         status_metadata = {'completed_at': datetime.now().isoformat()}
         if metadata:
             status_metadata.update(metadata)
@@ -196,19 +377,81 @@ def get_session_workspaces(cerebrum_path: Path) -> list:
     Returns:
         List of SessionWorkspace objects
     """
-    sessions_dir = cerebrum_path / '.ai' / 'subconscious' / '.ai' / 'sessions'
+    layout = get_cerebrum_layout(cerebrum_path)
+    sessions_dir = layout.sessions_dir
     if not sessions_dir.exists():
         return []
 
+    # scandir reports the entry type from the directory itself - no
+    # per-entry stat like iterdir + is_dir
     workspaces = []
-    for session_dir in sessions_dir.iterdir():
-        if session_dir.is_dir():
-            workspace = SessionWorkspace(session_dir.name, cerebrum_path)
-            workspaces.append(workspace)
+    with os.scandir(sessions_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                workspaces.append(SessionWorkspace(entry.name, cerebrum_path, layout=layout))
 
     return workspaces
 
 
+def _read_status_field(status_file: Path, field: str = 'status') -> Optional[str]:
+    """
+    Read one string field from a status JSON without a full parse.
+
+    mmaps the file and slices the quoted value out after locating the
+    key with mm.find (memchr in C) - no json.loads, no str decode of the
+    rest of the file. Results are cached against st_mtime_ns, so an
+    unchanged file costs a single fstat on the next call. Falls back to
+    json.load for anything that doesn't match the expected layout.
+
+    Args:
+        status_file: Path to the status JSON file
+        field: Field name to extract (must hold a string value)
+
+    Returns:
+        Field value, or None if the file or field is missing
+    """
+    key = (str(status_file), field)
+    needle = f'"{field}"'.encode('utf-8')
+    value = None
+    try:
+        with open(status_file, 'rb') as f:
+            stat_result = os.fstat(f.fileno())
+            cached = _status_field_cache.get(key)
+            if cached is not None and cached[0] == stat_result.st_mtime_ns:
+                return cached[1]
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty or unmappable file (e.g. an in-memory test
+                # filesystem) - the json.load fallback below handles it
+                mm = None
+            if mm is not None:
+                try:
+                    pos = mm.find(needle)
+                    if pos != -1:
+                        colon = mm.find(b':', pos + len(needle))
+                        start = mm.find(b'"', colon + 1) if colon != -1 else -1
+                        end = mm.find(b'"', start + 1) if start != -1 else -1
+                        if end != -1:
+                            value = mm[start + 1:end].decode('utf-8')
+                finally:
+                    mm.close()
+    except OSError:
+        return None
+
+    if value is None:
+        # Unexpected layout or unmappable file - pay for the full parse
+        try:
+            with open(status_file) as f:
+                loaded = json.load(f).get(field)
+            value = loaded if isinstance(loaded, str) else None
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    _status_field_cache[key] = (stat_result.st_mtime_ns, value)
+    return value
+
+
 def get_active_sessions(cerebrum_path: Path) -> list:
     """
     Get all active (processing or complete but not merged) sessions.
@@ -223,8 +466,10 @@ def get_active_sessions(cerebrum_path: Path) -> list:
     active = []
 
     for workspace in workspaces:
-        status = workspace.get_status()
-        if status['status'] in ('processing', 'complete'):
-            active.append((workspace, status))
+        # Cheap single-field probe first; the full status JSON is only
+        # parsed for workspaces that are actually active
+        if _read_status_field(workspace.status_file) not in ('processing', 'complete'):
+            continue
+        active.append((workspace, workspace.get_status()))
 
     return active
@@ -9,14 +9,54 @@ Usage:
     python subconscious_worker.py <transcript_file> <cerebrum_path>
 """
 
+import os
+import re
 import sys
+import traceback
 import json
+import mmap
 import time
-import importlib.util
+import shutil
+import asyncio
+import hashlib
+import sqlite3
+import itertools
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+# flock-based locking is POSIX-only; fall back to a plain touch file elsewhere
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Optional fast JSON decoders for transcript events - jiter, orjson, and
+# msgspec all parse small JSON documents several times faster than stdlib
+# json, trimming per-line dispatch overhead on large transcripts
+try:
+    import jiter
+    _decode_event = jiter.from_json
+except ImportError:
+    try:
+        import orjson
+        _decode_event = orjson.loads
+    except ImportError:
+        try:
+            import msgspec.json
+            _decode_event = msgspec.json.decode
+        except ImportError:
+            _decode_event = json.loads
+
+# Make sibling modules importable regardless of the invocation cwd.
+# Plain imports go through Python's module cache and .pyc bytecode cache,
+# which is meaningfully faster than spec_from_file_location + exec_module
+# for a worker that starts a fresh interpreter per session.
+_MODULE_DIR = str(Path(__file__).parent)
+if _MODULE_DIR not in sys.path:
+    sys.path.insert(0, _MODULE_DIR)
+
 # Import session workspace management
 try:
     from session_workspace import SessionWorkspace
@@ -26,76 +66,94 @@ except ImportError:
 
 # Import terminal parser if available
 try:
-    parser_path = Path(__file__).parent / 'terminal_parser.py'
-    if parser_path.exists():
-        spec = importlib.util.spec_from_file_location("terminal_parser", parser_path)
-        terminal_parser = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(terminal_parser)
-        HAS_PARSER = True
-    else:
-        HAS_PARSER = False
-except Exception:
+    import terminal_parser
+    HAS_PARSER = True
+except ImportError:
     HAS_PARSER = False
 
 # Import analyzer factory if available
 try:
-    analyzer_factory_path = Path(__file__).parent / 'analyzer_factory.py'
-    if analyzer_factory_path.exists():
-        spec = importlib.util.spec_from_file_location("analyzer_factory", analyzer_factory_path)
-        analyzer_factory = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(analyzer_factory)
-        HAS_ANALYZER = True
-    else:
-        HAS_ANALYZER = False
-except Exception:
+    import analyzer_factory
+    HAS_ANALYZER = True
+except ImportError:
     HAS_ANALYZER = False
 
 # Import conversation chunker if available
 try:
-    chunker_path = Path(__file__).parent / 'conversation_chunker.py'
-    if chunker_path.exists():
-        spec = importlib.util.spec_from_file_location("conversation_chunker", chunker_path)
-        conversation_chunker = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(conversation_chunker)
-        HAS_CHUNKER = True
-    else:
-        HAS_CHUNKER = False
-except Exception:
+    import conversation_chunker
+    HAS_CHUNKER = True
+except ImportError:
     HAS_CHUNKER = False
 
 # Import procedural extractor if available
 try:
-    extractor_path = Path(__file__).parent / 'procedural_extractor.py'
-    if extractor_path.exists():
-        spec = importlib.util.spec_from_file_location("procedural_extractor", extractor_path)
-        procedural_extractor = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(procedural_extractor)
-        HAS_PROCEDURAL = True
-    else:
-        HAS_PROCEDURAL = False
-except Exception:
+    import procedural_extractor
+    HAS_PROCEDURAL = True
+except ImportError:
     HAS_PROCEDURAL = False
 
 # Import project state analyzer if available
 try:
-    project_analyzer_path = Path(__file__).parent / 'project_state_analyzer.py'
-    if project_analyzer_path.exists():
-        spec = importlib.util.spec_from_file_location("project_state_analyzer", project_analyzer_path)
-        project_state_analyzer = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(project_state_analyzer)
-        HAS_PROJECT_ANALYZER = True
-    else:
-        HAS_PROJECT_ANALYZER = False
-except Exception:
+    import project_state_analyzer
+    HAS_PROJECT_ANALYZER = True
+except ImportError:
     HAS_PROJECT_ANALYZER = False
 
+# Session ID embedded in transcript filenames (transcript_YYYYMMDD_HHMMSS_*)
+_TRANSCRIPT_RE = re.compile(r'transcript_(\d{8}_\d{6})')
+
+# Per-directory listing cache for recording lookups - one scandir pass
+# amortized across all find_terminal_recording calls
+_RECORDINGS_CACHE = {}
+
+
+class LogBuffer:
+    """
+    Collects timestamped log lines and writes them in batches.
+
+    Instead of an open/write/close cycle per line, lines accumulate in
+    memory and flush() issues one gather write (os.writev where available)
+    per processing phase, keeping syscall count low on chatty runs.
+    """
+
+    def __init__(self, log_file: Path):
+        self.log_file = log_file
+        self._lines = []
+        self._fd = None
+        # Second-resolution timestamp prefix, reformatted only when the
+        # second rolls over - skips a datetime construction + isoformat
+        # allocation per line on chatty runs
+        self._last_sec = 0
+        self._last_stamp = ''
+
+    def add(self, message: str):
+        """Buffer a timestamped log line."""
+        sec = int(time.time())
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        self._lines.append(f"{self._last_stamp} {message}\n".encode('utf-8'))
+
+    def flush(self):
+        """Write all buffered lines in one batch."""
+        if not self._lines:
+            return
+        if self._fd is None:
+            self._fd = os.open(
+                self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+            )
+        if hasattr(os, 'writev'):
+            os.writev(self._fd, self._lines)
+        else:
+            os.write(self._fd, b''.join(self._lines))
+        self._lines.clear()
 
-def log(log_file: Path, message: str):
-    """Write to processing log."""
-    with open(log_file, 'a') as f:
-        timestamp = datetime.now().isoformat()
-        f.write(f"{timestamp} {message}\n")
-        f.flush()
+    def close(self):
+        """Flush remaining lines and close the log file."""
+        self.flush()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
 
 def create_best_analyzer(prompt_path: Path, output_dir: Optional[Path] = None, agent: str = 'claude'):
@@ -125,14 +183,85 @@ def create_best_analyzer(prompt_path: Path, output_dir: Optional[Path] = None, a
     )
 
 
-def load_transcript(filepath: Path) -> list:
-    """Load JSONL transcript file."""
-    events = []
-    with open(filepath) as f:
-        for line in f:
-            if line.strip():
-                events.append(json.loads(line))
-    return events
+def load_transcript(filepath: Path):
+    """
+    Stream events from a JSONL transcript file.
+
+    Yields parsed events one at a time so consumers can walk large
+    transcripts without retaining the full event list. Callers that need
+    everything in memory can use list(load_transcript(...)).
+    """
+    # Map the file and slice line boundaries with mm.find (memchr in C)
+    # instead of reading the whole file into a Python bytes object first.
+    # Line bytes go straight to the decoder - all supported decoders
+    # accept them, skipping an up-front UTF-8 decode of the full file.
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped and hold no events
+            return
+        try:
+            pos = 0
+            size = len(mm)
+            while pos < size:
+                newline = mm.find(b'\n', pos)
+                if newline == -1:
+                    newline = size
+                line = mm[pos:newline]
+                if line.strip():
+                    yield _decode_event(line)
+                pos = newline + 1
+        finally:
+            mm.close()
+
+
+def load_session_bounds(filepath: Path):
+    """
+    Read the boundary events of a transcript without decoding every line.
+
+    Basic statistics only need the session_start and session_end events,
+    which TranscriptCapture writes as the first and last lines. Decoding
+    just those two and counting the lines in between (memchr walk, no
+    JSON parse) keeps the stats pass O(1) in decode work regardless of
+    transcript size.
+
+    Returns:
+        Tuple of (first_event, last_event, event_count); (None, None, 0)
+        for an empty file. first_event and last_event are the same object
+        for a single-line transcript.
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped and hold no events
+            return None, None, 0
+        try:
+            pos = 0
+            size = len(mm)
+            event_count = 0
+            first = None
+            last_span = None
+            while pos < size:
+                newline = mm.find(b'\n', pos)
+                if newline == -1:
+                    newline = size
+                # Non-empty check on offsets alone - no per-line slice
+                if newline > pos:
+                    event_count += 1
+                    if first is None:
+                        first = _decode_event(mm[pos:newline])
+                    last_span = (pos, newline)
+                pos = newline + 1
+
+            if first is None:
+                return None, None, 0
+            if event_count == 1:
+                return first, first, 1
+            return first, _decode_event(mm[last_span[0]:last_span[1]]), event_count
+        finally:
+            mm.close()
 
 
 def find_terminal_recording(transcript_file: Path, cerebrum_path: Path) -> Optional[Path]:
@@ -148,26 +277,29 @@ def find_terminal_recording(transcript_file: Path, cerebrum_path: Path) -> Optio
     """
     # Extract session ID from transcript filename
     # Format: transcript_YYYYMMDD_HHMMSS_*.jsonl -> terminal_YYYYMMDD_HHMMSS.txt
-    import re
-    match = re.search(r'transcript_(\d{8}_\d{6})', transcript_file.name)
+    match = _TRANSCRIPT_RE.search(transcript_file.name)
     if not match:
         return None
 
     session_id = match.group(1)
 
-    # Look for terminal recording
+    # Look for terminal recording via a cached directory listing - one
+    # scandir pass replaces per-call stat syscalls (a missing directory
+    # just caches an empty listing)
     recordings_dir = cerebrum_path / '.ai' / 'subconscious' / '.ai' / 'recordings'
-    if not recordings_dir.exists():
-        return None
-
-    recording_file = recordings_dir / f'terminal_{session_id}.txt'
-    if recording_file.exists():
-        return recording_file
+    listing = _RECORDINGS_CACHE.get(recordings_dir)
+    if listing is None:
+        try:
+            with os.scandir(recordings_dir) as entries:
+                listing = {entry.name: Path(entry.path) for entry in entries}
+        except OSError:
+            listing = {}
+        _RECORDINGS_CACHE[recordings_dir] = listing
 
-    return None
+    return listing.get(f'terminal_{session_id}.txt')
 
 
-def process_transcript_basic(events: list, terminal_data: Optional[dict] = None) -> dict:
+def process_transcript_basic(events, terminal_data: Optional[dict] = None) -> dict:
     """
     Basic transcript processing (placeholder for LLM processing).
 
@@ -175,17 +307,27 @@ def process_transcript_basic(events: list, terminal_data: Optional[dict] = None)
     For now, just extract simple statistics.
 
     Args:
-        events: List of transcript events
+        events: Iterable of transcript events (list or generator)
         terminal_data: Optional parsed terminal recording data
 
     Returns:
         Analysis dictionary
     """
-    session_start = next((e for e in events if e['type'] == 'session_start'), None)
-    session_end = next((e for e in events if e['type'] == 'session_end'), None)
+    # Count events and find both boundary events in a single pass, so a
+    # streamed transcript is consumed exactly once
+    session_start = None
+    session_end = None
+    event_count = 0
+    for event in events:
+        event_count += 1
+        event_type = event['type']
+        if session_start is None and event_type == 'session_start':
+            session_start = event
+        elif session_end is None and event_type == 'session_end':
+            session_end = event
 
     analysis = {
-        'event_count': len(events),
+        'event_count': event_count,
         'agent': session_start['metadata']['agent'] if session_start else 'unknown',
         'workspace': session_start['metadata']['workspace'] if session_start else 'unknown',
         'duration': session_end['metadata']['duration'] if session_end else 0,
@@ -233,20 +375,102 @@ def _analyze_with_chunking(
     Returns:
         Combined AnalysisResult from all chunks
     """
-    # Create chunker
-    chunker = conversation_chunker.create_chunker(target_size=150000)
-    chunks = chunker.chunk(conversation_text, strategy='natural')
+    # Sequential mode threads a summary between chunks, so it wants clean
+    # natural boundaries; parallel mode uses overlapping sliding windows
+    # instead - the shared overlap carries boundary context without any
+    # cross-chunk dependency, and dedup absorbs repeated findings
+    sequential = bool(os.environ.get('SAMANTHA_SEQUENTIAL_CHUNKS'))
+    strategy = 'natural' if sequential else 'sliding'
+
+    # Balance chunk sizes: divide the text evenly across the minimum
+    # number of 150k-char chunks instead of cutting fixed 150k slices,
+    # which avoids a tiny tail chunk paying a full LLM round-trip
+    chunk_count = -(-len(conversation_text) // 150000)  # ceil div
+    if strategy == 'sliding':
+        # Sliding windows advance by target_size minus a 10% overlap, so
+        # chunk_count windows only cover ~(0.9 * count + 0.1) * target
+        # chars. Solve that coverage equation for target instead of the
+        # plain ceil - otherwise the overlap pushes an extra tiny tail
+        # window past chunk_count.
+        target_size = -(-10 * len(conversation_text) // (9 * chunk_count + 1))
+    else:
+        target_size = -(-len(conversation_text) // chunk_count)
+    log_func(f"[LLM] Adaptive chunk size: {target_size:,} chars for {chunk_count} chunks")
+
+    chunker = conversation_chunker.create_chunker(target_size=target_size)
+    chunks = chunker.chunk(conversation_text, strategy=strategy)
 
-    log_func(f"[LLM] Split conversation into {len(chunks)} chunks")
+    log_func(f"[LLM] Split conversation into {len(chunks)} chunks ({strategy})")
 
     # Initialize chunk manifest if workspace provided
     if workspace:
         workspace.init_chunk_manifest(len(chunks))
 
+    # When debugging, write all chunk files in one pass up front instead
+    # of interleaving small writes with the analysis calls
+    if os.environ.get('SAMANTHA_DEBUG_PARSED'):
+        for chunk in chunks:
+            chunk_file = parsed_dir / f'parsed_{session_id}_chunk{chunk.chunk_index + 1}.txt'
+            chunk_file.write_text(chunk.text)
+
     # Create analyzer with output_dir to save raw LLM output for each chunk
     analyzer = create_best_analyzer(prompt_path, output_dir=analyses_dir, agent=agent)
 
-    # Process each chunk with context from previous chunks
+    # Map-reduce by default: each chunk is analyzed independently in
+    # parallel (map), then _merge_chunk_results combines them (reduce).
+    # The old context chain serialized all N LLM round-trips purely to
+    # thread a summary between chunks; set SAMANTHA_SEQUENTIAL_CHUNKS to
+    # restore that behavior.
+    if sequential or len(chunks) == 1:
+        chunk_results = _analyze_chunks_sequential(
+            chunks, session_id, analyzer, parsed_dir, log_func, workspace
+        )
+    else:
+        chunk_results = _analyze_chunks_parallel(
+            chunks, session_id, analyzer, parsed_dir, log_func, workspace
+        )
+
+    # Merge all chunk results
+    log_func(f"[LLM] Merging {len(chunk_results)} chunk results...")
+    merged_result = _merge_chunk_results(chunk_results, session_id, log_func)
+
+    # Save combined parsed analysis (Part 2 only - for guidance)
+    combined_parsed_file = analyses_dir / f'analysis_{session_id}_parsed.md'
+    combined_parsed_file.write_text(merged_result.to_markdown())
+    log_func(f"[LLM] Combined parsed analysis saved to: {combined_parsed_file}")
+
+    # Combine all raw chunk outputs (includes Part 1 + Part 2 for each chunk)
+    # from the results already in memory - no re-read of the chunk files
+    log_func(f"[LLM] Combining raw chunk outputs...")
+    combined_sections = [
+        f"# Chunk {i + 1}/{len(chunk_results)}\n\n{chunk_result.raw_output}"
+        for i, chunk_result in enumerate(chunk_results)
+        if chunk_result.raw_output
+    ]
+
+    # Save combined raw output (full detailed analysis)
+    combined_raw_file = analyses_dir / f'analysis_{session_id}_full.md'
+    combined_raw_file.write_text("\n\n---\n\n".join(combined_sections))
+    log_func(f"[LLM] Combined raw analysis saved to: {combined_raw_file}")
+
+    return merged_result
+
+
+def _analyze_chunks_sequential(chunks, session_id, analyzer, parsed_dir, log_func, workspace):
+    """
+    Analyze chunks one at a time, passing context between them.
+
+    Args:
+        chunks: List of Chunk objects
+        session_id: Session identifier
+        analyzer: Configured analyzer instance
+        parsed_dir: Directory for parsed text
+        log_func: Logging function to call
+        workspace: Optional SessionWorkspace for manifest tracking
+
+    Returns:
+        List of AnalysisResult objects for successful chunks
+    """
     chunk_results = []
     accumulated_context = ""
 
@@ -266,13 +490,12 @@ def _analyze_with_chunking(
         else:
             chunk_text_with_context = chunk.text
 
-        # Write chunk to temp file
-        chunk_file = parsed_dir / f'parsed_{session_id}_chunk{chunk_num}.txt'
-        chunk_file.write_text(chunk_text_with_context)
-
         # Analyze chunk (raw output automatically saved to analyses_dir)
         try:
-            result = analyzer.analyze(chunk_file)
+            result = analyzer.analyze_text(
+                chunk_text_with_context,
+                session_id=f'{session_id}_chunk{chunk_num}'
+            )
 
             log_func(f"[LLM] Chunk {chunk_num} complete: {len(result.patterns)} patterns, {len(result.decisions)} decisions")
             log_func(f"[LLM] Raw output saved: analysis_{session_id}_chunk{chunk_num}.md")
@@ -294,6 +517,10 @@ def _analyze_with_chunking(
         except Exception as e:
             log_func(f"[ERROR] Chunk {chunk_num} analysis failed: {e}")
 
+            # Persist the chunk text so chunk_retry has an input to re-run
+            chunk_file = parsed_dir / f'parsed_{session_id}_chunk{chunk_num}.txt'
+            chunk_file.write_text(chunk_text_with_context)
+
             # Mark chunk as failed
             if workspace:
                 workspace.update_chunk_status(chunk_num, 'failed', {
@@ -305,31 +532,251 @@ def _analyze_with_chunking(
             # Continue with remaining chunks
             continue
 
-    # Merge all chunk results
-    log_func(f"[LLM] Merging {len(chunk_results)} chunk results...")
-    merged_result = _merge_chunk_results(chunk_results, session_id, log_func)
+    return chunk_results
 
-    # Save combined parsed analysis (Part 2 only - for guidance)
-    combined_parsed_file = analyses_dir / f'analysis_{session_id}_parsed.md'
-    combined_parsed_file.write_text(merged_result.to_markdown())
-    log_func(f"[LLM] Combined parsed analysis saved to: {combined_parsed_file}")
 
-    # Combine all raw chunk outputs (includes Part 1 + Part 2 for each chunk)
-    log_func(f"[LLM] Combining raw chunk outputs...")
-    combined_sections = []
-    for i in range(len(chunk_results)):
-        chunk_num = i + 1
-        chunk_raw_file = analyses_dir / f'analysis_{session_id}_chunk{chunk_num}.md'
-        if chunk_raw_file.exists():
-            chunk_content = chunk_raw_file.read_text()
-            combined_sections.append(f"# Chunk {chunk_num}/{len(chunk_results)}\n\n{chunk_content}")
+# Chunks below this size are candidates for row-marshaling into a
+# single LLM call; larger chunks always go out as their own request
+_ROW_MARSHAL_SMALL_CHUNK = 50000
 
-    # Save combined raw output (full detailed analysis)
-    combined_raw_file = analyses_dir / f'analysis_{session_id}_full.md'
-    combined_raw_file.write_text("\n\n---\n\n".join(combined_sections))
-    log_func(f"[LLM] Combined raw analysis saved to: {combined_raw_file}")
 
-    return merged_result
+def _marshal_chunk_batches(chunks, budget):
+    """
+    Pack contiguous small chunks into batches for row-marshaled LLM calls.
+
+    First-fit over the ordered chunk list: small chunks (<50k chars)
+    accumulate into the current batch while the cumulative length stays
+    within budget; large chunks always form singleton batches. Sending
+    one prompt per batch amortizes per-request network and queue overhead
+    when a session produced many short chunks.
+
+    Args:
+        chunks: Ordered list of Chunk objects
+        budget: Max cumulative chars per batch (0 disables batching)
+
+    Returns:
+        List of lists of Chunk objects, preserving chunk order
+    """
+    batches = []
+    current = []
+    current_size = 0
+
+    for chunk in chunks:
+        size = len(chunk)
+        if (budget and current and size < _ROW_MARSHAL_SMALL_CHUNK
+                and current_size + size <= budget
+                and len(current[-1]) < _ROW_MARSHAL_SMALL_CHUNK):
+            current.append(chunk)
+            current_size += size
+        else:
+            if current:
+                batches.append(current)
+            current = [chunk]
+            current_size = size
+
+    if current:
+        batches.append(current)
+
+    return batches
+
+
+def _build_row_prompt(batch):
+    """Concatenate a batch of chunks under --- ROW n --- delimiters."""
+    header = (
+        f"The input below contains {len(batch)} independent conversation "
+        "segments separated by '--- ROW n ---' markers. Analyze each "
+        "segment separately and emit one full analysis per segment, "
+        "preceded by the matching '--- ROW n ---' marker."
+    )
+    parts = [header]
+    for i, chunk in enumerate(batch):
+        parts.append(f"--- ROW {i + 1} ---\n{chunk.text}")
+    return "\n\n".join(parts)
+
+
+_ROW_SPLIT_RE = re.compile(r'^--- ROW \d+ ---\s*$', re.MULTILINE)
+
+
+def _split_row_output(raw_output, expected_rows):
+    """
+    Split row-marshaled LLM output back into per-row raw analyses.
+
+    Returns a list of row texts when the model honored the delimiters,
+    or None when the output cannot be split into the expected row count.
+    """
+    if not raw_output:
+        return None
+    rows = [part.strip() for part in _ROW_SPLIT_RE.split(raw_output)]
+    rows = [part for part in rows if part]
+    if len(rows) != expected_rows:
+        return None
+    return rows
+
+
+def _analyze_chunks_parallel(chunks, session_id, analyzer, parsed_dir, log_func, workspace):
+    """
+    Analyze independent chunks concurrently with a thread pool.
+
+    Chunks get no cross-chunk context in this mode, so the N LLM calls
+    have no ordering dependency and can overlap. Contiguous small chunks
+    are additionally row-marshaled into shared requests (see
+    _marshal_chunk_batches); results come back in chunk order.
+
+    Args:
+        chunks: List of Chunk objects
+        session_id: Session identifier
+        analyzer: Configured analyzer instance
+        parsed_dir: Directory for parsed text
+        log_func: Logging function to call
+        workspace: Optional SessionWorkspace for manifest tracking
+
+    Returns:
+        List of AnalysisResult objects for successful chunks, in chunk order
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from conversation_analyzer import AnalysisParser
+
+    # Manifest updates read-modify-write a shared file; serialize them
+    manifest_lock = threading.Lock()
+
+    # Fixed "sink" context prefix: a bounded summary of the session's
+    # first chunk, computed once and prepended to every later chunk.
+    # Unlike the old growing accumulated_context, its cost per chunk is
+    # constant regardless of session length; the sliding-window overlap
+    # supplies the recent-tail half of the context.
+    sink = ['']
+
+    def with_sink(chunk):
+        if sink[0] and chunk.chunk_index > 0:
+            return f"{sink[0]}\n---\n{chunk.text}"
+        return chunk.text
+
+    def mark_chunk(chunk_num, status, metadata):
+        if not workspace:
+            return
+        with manifest_lock:
+            workspace.update_chunk_status(chunk_num, status, metadata)
+
+    def analyze_one(chunk):
+        chunk_num = chunk.chunk_index + 1
+        log_func(f"[LLM] Analyzing chunk {chunk_num}/{chunk.total_chunks} ({len(chunk):,} chars, boundary: {chunk.boundary_reason})")
+        mark_chunk(chunk_num, 'processing', {'started_at': datetime.now().isoformat()})
+
+        chunk_text = with_sink(chunk)
+
+        try:
+            result = analyzer.analyze_text(
+                chunk_text,
+                session_id=f'{session_id}_chunk{chunk_num}'
+            )
+
+            log_func(f"[LLM] Chunk {chunk_num} complete: {len(result.patterns)} patterns, {len(result.decisions)} decisions")
+            mark_chunk(chunk_num, 'complete', {
+                'completed_at': datetime.now().isoformat(),
+                'patterns_count': len(result.patterns),
+                'decisions_count': len(result.decisions)
+            })
+            return result
+
+        except Exception as e:
+            log_func(f"[ERROR] Chunk {chunk_num} analysis failed: {e}")
+            chunk_file = parsed_dir / f'parsed_{session_id}_chunk{chunk_num}.txt'
+            chunk_file.write_text(chunk_text)
+            mark_chunk(chunk_num, 'failed', {
+                'failed_at': datetime.now().isoformat(),
+                'error': str(e)
+            })
+            return None
+
+    def analyze_batch(batch):
+        if len(batch) == 1:
+            return [analyze_one(batch[0])]
+
+        chunk_nums = [chunk.chunk_index + 1 for chunk in batch]
+        log_func(f"[LLM] Row-marshaling chunks {chunk_nums[0]}-{chunk_nums[-1]} "
+                 f"into one request ({sum(len(c) for c in batch):,} chars)")
+        for chunk_num in chunk_nums:
+            mark_chunk(chunk_num, 'processing', {'started_at': datetime.now().isoformat()})
+
+        row_prompt = _build_row_prompt(batch)
+        if sink[0] and batch[0].chunk_index > 0:
+            row_prompt = f"{sink[0]}\n---\n{row_prompt}"
+
+        try:
+            batch_result = analyzer.analyze_text(
+                row_prompt,
+                session_id=f'{session_id}_rows{chunk_nums[0]}-{chunk_nums[-1]}'
+            )
+        except Exception as e:
+            log_func(f"[ERROR] Row batch {chunk_nums[0]}-{chunk_nums[-1]} failed: {e}")
+            for chunk, chunk_num in zip(batch, chunk_nums):
+                chunk_file = parsed_dir / f'parsed_{session_id}_chunk{chunk_num}.txt'
+                chunk_file.write_text(chunk.text)
+                mark_chunk(chunk_num, 'failed', {
+                    'failed_at': datetime.now().isoformat(),
+                    'error': str(e)
+                })
+            return [None] * len(batch)
+
+        rows = _split_row_output(batch_result.raw_output, len(batch))
+        if rows is None:
+            # Model ignored the delimiters; keep the combined analysis as a
+            # single result credited to the first chunk rather than dropping
+            # it, and mark the rest failed with their chunk text persisted
+            # so chunk_retry can re-analyze them individually
+            log_func(f"[LLM] Row batch {chunk_nums[0]}-{chunk_nums[-1]} came back "
+                     "undelimited; keeping combined result, retrying the rest")
+            for chunk, chunk_num in zip(batch[1:], chunk_nums[1:]):
+                chunk_file = parsed_dir / f'parsed_{session_id}_chunk{chunk_num}.txt'
+                chunk_file.write_text(chunk.text)
+                mark_chunk(chunk_num, 'failed', {
+                    'failed_at': datetime.now().isoformat(),
+                    'error': 'Row-marshaled output came back undelimited'
+                })
+            results = [batch_result] + [None] * (len(batch) - 1)
+        else:
+            results = [AnalysisParser.parse(row) for row in rows]
+
+        for chunk_num, result in zip(chunk_nums, results):
+            if result is not None:
+                mark_chunk(chunk_num, 'complete', {
+                    'completed_at': datetime.now().isoformat(),
+                    'patterns_count': len(result.patterns),
+                    'decisions_count': len(result.decisions)
+                })
+        return results
+
+    try:
+        budget = int(os.environ.get('ROW_MARSHAL_BATCH_SIZE', 150000))
+    except ValueError:
+        budget = 150000
+    batches = _marshal_chunk_batches(chunks, budget)
+
+    log_func(f"[LLM] Analyzing {len(chunks)} independent chunks as {len(batches)} requests")
+
+    results = []
+    remaining = batches
+    if len(batches) > 1:
+        # Analyze the first batch up front; its bounded summary becomes
+        # the sink prefix for everything that follows
+        first_results = analyze_batch(batches[0])
+        first_ok = next((r for r in first_results if r is not None), None)
+        if first_ok:
+            sink[0] = first_ok.to_context_summary()
+        results.extend(first_results)
+        remaining = batches[1:]
+
+    max_workers = min(len(remaining), 5)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results.extend(
+            r for batch_results in executor.map(analyze_batch, remaining)
+            for r in batch_results
+        )
+
+    # Drop failed chunks, preserving chunk order
+    return [r for r in results if r is not None]
 
 
 def _merge_chunk_results(chunk_results, session_id: str, log_func):
@@ -352,50 +799,31 @@ def _merge_chunk_results(chunk_results, session_id: str, log_func):
     if len(chunk_results) == 1:
         return chunk_results[0]
 
-    # Combine all lists, removing duplicates while preserving order
+    # Combine all lists, removing duplicates while preserving order.
+    # Dicts keep insertion order, so a single comprehension keyed on the
+    # normalized form fuses the seen-set and result-list bookkeeping.
     def dedupe_list(items):
-        seen = set()
-        result = []
-        for item in items:
-            # Normalize for comparison (lowercase, strip)
-            normalized = item.lower().strip()
-            if normalized not in seen:
-                seen.add(normalized)
-                result.append(item)
-        return result
-
-    all_patterns = []
-    all_decisions = []
-    all_todos = []
-    all_preferences = []
-    all_learnings = []
-    summaries = []
-
-    for i, result in enumerate(chunk_results):
-        # Add chunk marker to items for traceability
-        chunk_num = i + 1
-
-        all_patterns.extend(result.patterns)
-        all_decisions.extend(result.decisions)
-        all_todos.extend(result.todos)
-        all_preferences.extend(result.preferences)
-        all_learnings.extend(result.learnings)
-
-        # Extract session summary (truncate if too long to keep guidance lightweight)
-        if result.summary:
-            summary_text = result.summary.strip()
-            # If summary is very long (>500 chars), it likely includes Part 1 content - truncate it
-            if len(summary_text) > 500:
-                summary_text = summary_text[:497] + "..."
-            summaries.append(f"**Chunk {chunk_num}**: {summary_text}")
+        return list({item.lower().strip(): item for item in items}.values())
+
+    # Flatten each category in C via chain.from_iterable rather than
+    # per-result list.extend calls in the interpreter
+    chain = itertools.chain.from_iterable
+
+    # Chunk-numbered summaries, truncated past 500 chars to keep guidance
+    # lightweight (very long summaries usually include Part 1 content)
+    summaries = [
+        f"**Chunk {i + 1}**: {s[:497] + '...' if len(s := result.summary.strip()) > 500 else s}"
+        for i, result in enumerate(chunk_results)
+        if result.summary
+    ]
 
     # Deduplicate
     merged = AnalysisResult(
-        patterns=dedupe_list(all_patterns),
-        decisions=dedupe_list(all_decisions),
-        todos=dedupe_list(all_todos),
-        preferences=dedupe_list(all_preferences),
-        learnings=dedupe_list(all_learnings),
+        patterns=dedupe_list(chain(r.patterns for r in chunk_results)),
+        decisions=dedupe_list(chain(r.decisions for r in chunk_results)),
+        todos=dedupe_list(chain(r.todos for r in chunk_results)),
+        preferences=dedupe_list(chain(r.preferences for r in chunk_results)),
+        learnings=dedupe_list(chain(r.learnings for r in chunk_results)),
         summary="\n\n".join(summaries) if summaries else None
     )
 
@@ -404,6 +832,72 @@ def _merge_chunk_results(chunk_results, session_id: str, log_func):
     return merged
 
 
+# Summary lines starting with these are structure, not content - skipped
+# when building the guidance one-liner. startswith with a tuple dispatches
+# all prefixes in a single C call.
+_SKIP_PREFIXES = ('**Chunk', '#', '**Detailed', '**High-Level')
+
+# data: URI payloads (pasted images, audio) embedded in conversations -
+# replaced with short placeholders before LLM analysis
+_BASE64_BLOB_RE = re.compile(r'data:[^;,\s]+;base64,[A-Za-z0-9+/=]+')
+
+
+def _strip_base64(text: str) -> str:
+    """
+    Replace embedded base64 payloads with numbered placeholders.
+
+    Base64 attachments inflate LLM token counts massively without adding
+    analyzable content; a session with a few pasted screenshots can
+    multiply chunk count several times over.
+
+    Args:
+        text: Conversation text possibly containing data: URIs
+
+    Returns:
+        Text with each payload replaced by an [attachment N] marker
+    """
+    counter = [0]
+
+    def replace(match):
+        counter[0] += 1
+        return f'[attachment {counter[0]}]'
+
+    return _BASE64_BLOB_RE.sub(replace, text)
+
+
+def _open_analysis_cache(cerebrum_path: Path) -> sqlite3.Connection:
+    """
+    Open (creating if needed) the analysis result cache.
+
+    The cache maps a content hash of the conversation text to the analysis
+    dict a prior run produced, so re-processing an identical transcript
+    skips the LLM calls entirely.
+
+    Args:
+        cerebrum_path: Path to cerebrum root
+
+    Returns:
+        sqlite3 connection with the schema ensured
+    """
+    cache_db = cerebrum_path / '.ai' / 'subconscious' / '.ai' / 'cache.db'
+    cache_db.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_db)
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS analyses ('
+        'hash TEXT PRIMARY KEY, '
+        'result TEXT NOT NULL, '
+        'created_at TEXT NOT NULL)'
+    )
+    return conn
+
+
+def _conversation_cache_key(conversation_text: str) -> str:
+    """Content hash used as the exact-match cache key."""
+    return hashlib.blake2b(
+        conversation_text.encode('utf-8'), digest_size=16
+    ).hexdigest()
+
+
 def process_transcript_llm(terminal_data: dict, cerebrum_path: Path, log_func, workspace: Optional['SessionWorkspace'] = None) -> Optional[dict]:
     """
     Process transcript using LLM analysis.
@@ -443,14 +937,42 @@ def process_transcript_llm(terminal_data: dict, cerebrum_path: Path, log_func, w
         session_id = terminal_data.get('metadata', {}).get('session_id', 'unknown')
         agent = terminal_data.get('metadata', {}).get('agent', 'claude')
         conversation_text = terminal_data['raw_text']
+        raw_size = len(conversation_text)
+
+        # Drop base64 attachment payloads before sizing/chunking
+        conversation_text = _strip_base64(conversation_text)
         text_size = len(conversation_text)
+        if text_size < raw_size:
+            log_func(f"[LLM] Stripped base64 attachments: {raw_size:,} -> {text_size:,} chars "
+                     f"({text_size / raw_size:.0%} retained)")
 
         log_func(f"[LLM] Conversation size: {text_size:,} characters")
         log_func(f"[LLM] Session agent: {agent}")
 
-        # Check if chunking is needed
+        # Exact-match cache: an identical conversation analyzed before
+        # returns the stored result without any LLM round-trips
+        cache_conn = None
+        cache_key = _conversation_cache_key(conversation_text)
+        try:
+            cache_conn = _open_analysis_cache(cerebrum_path)
+            row = cache_conn.execute(
+                'SELECT result FROM analyses WHERE hash = ?', (cache_key,)
+            ).fetchone()
+            if row:
+                log_func(f"[LLM] Cache hit for conversation hash {cache_key}, skipping analysis")
+                cache_conn.close()
+                return json.loads(row[0])
+        except sqlite3.Error as e:
+            log_func(f"[WARN] Analysis cache unavailable: {e}")
+            if cache_conn is not None:
+                cache_conn.close()
+            cache_conn = None
+
+        # Check if chunking is needed. Transcripts only slightly over the
+        # threshold (<1.2x) still go out as one call - two LLM round-trips
+        # cost more than the marginally larger single prompt
         CHUNK_THRESHOLD = 150000
-        needs_chunking = text_size > CHUNK_THRESHOLD and HAS_CHUNKER
+        needs_chunking = text_size > CHUNK_THRESHOLD * 1.2 and HAS_CHUNKER
 
         if needs_chunking:
             log_func(f"[LLM] Conversation exceeds {CHUNK_THRESHOLD:,} chars, using chunked analysis")
@@ -468,13 +990,15 @@ def process_transcript_llm(terminal_data: dict, cerebrum_path: Path, log_func, w
             # Single-pass analysis (original behavior)
             log_func(f"[LLM] Starting conversation analysis...")
 
-            # Write to parsed directory
-            parsed_file = parsed_dir / f'parsed_{session_id}.txt'
-            parsed_file.write_text(conversation_text)
+            # Only persist the parsed round-trip file when debugging - the
+            # text is already in memory and goes straight to the analyzer
+            if os.environ.get('SAMANTHA_DEBUG_PARSED'):
+                parsed_file = parsed_dir / f'parsed_{session_id}.txt'
+                parsed_file.write_text(conversation_text)
 
             # Create analyzer and run analysis
             analyzer = create_best_analyzer(prompt_path, output_dir=analyses_dir, agent=agent)
-            result = analyzer.analyze(parsed_file)
+            result = analyzer.analyze_text(conversation_text, session_id=session_id)
 
             log_func(f"[LLM] Analysis complete: {len(result.patterns)} patterns, {len(result.decisions)} decisions, {len(result.todos)} TODOs")
             log_func(f"[LLM] Raw output saved to: {analyses_dir / f'analysis_{session_id}.md'}")
@@ -490,11 +1014,31 @@ def process_transcript_llm(terminal_data: dict, cerebrum_path: Path, log_func, w
             'llm_analysis': True
         }
 
+        if cache_conn is not None:
+            try:
+                # Only cache substantive analyses - an output that parsed
+                # to nothing (0 patterns, 0 decisions, ...) is a bad model
+                # response, and caching it would make it sticky: every
+                # reprocess of the same transcript would return the empty
+                # result instead of retrying the LLM
+                if result.is_empty():
+                    log_func("[CACHE] Analysis is empty; not caching")
+                else:
+                    cache_conn.execute(
+                        'INSERT OR REPLACE INTO analyses (hash, result, created_at) '
+                        'VALUES (?, ?, ?)',
+                        (cache_key, json.dumps(analysis_dict), datetime.now().isoformat())
+                    )
+                    cache_conn.commit()
+            except sqlite3.Error as e:
+                log_func(f"[WARN] Failed to cache analysis: {e}")
+            finally:
+                cache_conn.close()
+
         return analysis_dict
 
     except Exception as e:
         log_func(f"[ERROR] LLM analysis failed: {e}")
-        import traceback
         log_func(f"[ERROR] {traceback.format_exc()}")
         return None
 
@@ -655,29 +1199,19 @@ def generate_guidance_basic(cerebrum_path: Path, analysis: dict, llm_analysis: O
         guidance_dir.mkdir(parents=True, exist_ok=True)
         guidance_file = guidance_dir / 'guidance.md'
 
+    # Take the timestamp once - it's reused below and datetime.now() isn't free
+    now = datetime.now()
+    ts = now.isoformat()
+
     # Extract date from session_id or use current date
     session_id = analysis.get('session_id', 'unknown')
-    session_date = session_id.split('_')[0] if '_' in session_id else datetime.now().strftime('%Y%m%d')
+    session_date = session_id.split('_')[0] if '_' in session_id else now.strftime('%Y%m%d')
 
     # Format: YYYYMMDD -> YYYY-MM-DD
     if len(session_date) == 8:
         formatted_date = f"{session_date[0:4]}-{session_date[4:6]}-{session_date[6:8]}"
     else:
-        formatted_date = datetime.now().strftime('%Y-%m-%d')
-
-    # Build lightweight session entry
-    content_parts = [
-        f"""---
-last_updated: {datetime.now().isoformat()}
----
-
-# Subconscious Guidance
-
-Quick orientation from recent sessions. For detailed analysis, see files in `.ai/subconscious/.ai/analyses/`.
-
-## Recent Sessions
-"""
-    ]
+        formatted_date = now.strftime('%Y-%m-%d')
 
     # Create session entry
     duration_min = int(analysis['duration'] / 60)
@@ -693,12 +1227,7 @@ Quick orientation from recent sessions. For detailed analysis, see files in `.ai
             for line in summary.split('\n'):
                 line = line.strip()
                 # Skip empty lines, chunk markers, markdown headings, and labels
-                if (line and
-                    not line.startswith('**Chunk') and
-                    not line.startswith('#') and
-                    not line.endswith(':') and
-                    not line.startswith('**Detailed') and
-                    not line.startswith('**High-Level')):
+                if line and not line.startswith(_SKIP_PREFIXES) and not line.endswith(':'):
                     summary_lines.append(line)
 
             # Take first 2-3 meaningful lines or bullet points
@@ -719,20 +1248,45 @@ Quick orientation from recent sessions. For detailed analysis, see files in `.ai
     else:
         session_entry = f"- **{formatted_date}** ({duration_min}min, {workspace}): Processing... (analysis pending)"
 
-    content_parts.append(session_entry)
-    content_parts.append("")
+    # Stream each part straight into the buffered file handle rather than
+    # joining one large intermediate string first
+    with open(guidance_file, 'w', encoding='utf-8') as f:
+        f.write(f"""---
+last_updated: {ts}
+---
+
+# Subconscious Guidance
+
+Quick orientation from recent sessions. For detailed analysis, see files in `.ai/subconscious/.ai/analyses/`.
+
+## Recent Sessions
 
-    content_parts.append("""
+""")
+        f.write(session_entry)
+        f.write("\n\n")
+        f.write("""
 ---
 
 *Guidance is lightweight - detailed session notes and memories are in analysis files and will be processed into cerebrum memories in Phase 4.*
 """)
-
-    guidance_content = "\n".join(content_parts)
-    guidance_file.write_text(guidance_content)
     return guidance_file
 
 
+def _archive_transcript(transcript_file: Path, processed_file: Path):
+    """
+    Move the processed transcript into the archive directory.
+
+    Hard-link then unlink is zero-copy and atomic on any POSIX
+    filesystem; when the paths span filesystems (or hard links aren't
+    supported) shutil.move falls back to a copy.
+    """
+    try:
+        os.link(transcript_file, processed_file)
+        transcript_file.unlink()
+    except OSError:
+        shutil.move(str(transcript_file), str(processed_file))
+
+
 def main():
     """Main worker process."""
     if len(sys.argv) < 3:
@@ -743,8 +1297,7 @@ def main():
     cerebrum_path = Path(sys.argv[2])
 
     # Extract session ID from transcript filename
-    import re
-    match = re.search(r'transcript_(\d{8}_\d{6})', transcript_file.name)
+    match = _TRANSCRIPT_RE.search(transcript_file.name)
     session_id = match.group(1) if match else 'unknown'
 
     # Create session workspace if available
@@ -752,21 +1305,38 @@ def main():
     if HAS_WORKSPACE and session_id != 'unknown':
         workspace = SessionWorkspace(session_id, cerebrum_path)
         workspace.create()
-        log_func = workspace.log
         log_file = workspace.log_file
     else:
         # Fall back to old global logging
         log_dir = cerebrum_path / '.ai' / 'subconscious' / '.ai'
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / 'processing.log'
-        log_func = lambda msg: log(log_file, msg)
+
+    # Buffer log lines and batch-write them at phase boundaries
+    log_buf = LogBuffer(log_file)
+    log_func = log_buf.add
 
     # Create lock file (global for now, per-session later)
     lockfile = (workspace.root if workspace else log_dir) / '.processing.lock'
 
-    try:
-        # Acquire lock
+    # Acquire lock. flock gives real mutual exclusion between concurrent
+    # workers (touch/unlink races) and is released by the kernel if the
+    # process dies. The fd is held for the whole session.
+    lock_fd = None
+    if HAS_FCNTL:
+        lock_fd = os.open(lockfile, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            # Another worker holds the lock - exit cleanly
+            os.close(lock_fd)
+            log_func(f"[SKIP] Another worker holds the lock: {lockfile}")
+            log_buf.close()
+            sys.exit(0)
+    else:
         lockfile.touch()
+
+    try:
         log_func(f"[START] Processing {transcript_file.name}")
 
         # Load transcript
@@ -774,10 +1344,40 @@ def main():
             log_func(f"[ERROR] Transcript file not found: {transcript_file}")
             if workspace:
                 workspace.mark_failed(f"Transcript file not found: {transcript_file}")
+            log_buf.close()
             sys.exit(1)
 
-        events = load_transcript(transcript_file)
-        log_func(f"[LOAD] Loaded {len(events)} events")
+        # Idempotency check: a transcript whose content hash was already
+        # processed (duplicate invocation, debugging re-run) is skipped
+        # before any parsing happens
+        transcript_hash = hashlib.blake2b(transcript_file.read_bytes()).hexdigest()
+        try:
+            idem_conn = _open_analysis_cache(cerebrum_path)
+            idem_conn.execute(
+                'CREATE TABLE IF NOT EXISTS processed ('
+                'hash TEXT PRIMARY KEY, created_at TEXT NOT NULL)'
+            )
+            already_done = idem_conn.execute(
+                'SELECT 1 FROM processed WHERE hash = ?', (transcript_hash,)
+            ).fetchone()
+            idem_conn.close()
+            if already_done:
+                # The finally block flushes the log and releases the lock
+                log_func(f"[SKIP] Transcript already processed (hash {transcript_hash[:16]})")
+                sys.exit(0)
+        except sqlite3.Error as e:
+            log_func(f"[WARN] Idempotency cache unavailable: {e}")
+
+        # Only the boundary events feed the basic statistics, and the LLM
+        # phase reads the terminal recording rather than the event stream
+        # - so decode just the first and last lines and count the rest
+        first_event, last_event, event_count = load_session_bounds(transcript_file)
+        if first_event is None:
+            boundary_events = []
+        elif last_event is first_event:
+            boundary_events = [first_event]
+        else:
+            boundary_events = [first_event, last_event]
 
         # Find and parse terminal recording if available
         terminal_data = None
@@ -785,16 +1385,27 @@ def main():
             recording_file = find_terminal_recording(transcript_file, cerebrum_path)
             if recording_file:
                 try:
-                    terminal_data = terminal_parser.parse_terminal_recording(recording_file)
+                    # mmap the recording and hand the parser a direct view of
+                    # the bytes - one read of the file, no buffered copy
+                    try:
+                        with open(recording_file, 'rb') as f:
+                            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                                terminal_data = terminal_parser.parse_terminal_recording_bytes(mm)
+                    except ValueError:
+                        # Empty files can't be mapped
+                        terminal_data = terminal_parser.parse_terminal_recording(recording_file)
                     log_func(f"[PARSE] Parsed terminal recording: {len(terminal_data['raw_text'])} chars, {len(terminal_data['messages'])} messages")
                 except Exception as e:
                     log_func(f"[WARN] Failed to parse terminal recording: {e}")
 
         # Process transcript (basic statistics)
-        analysis = process_transcript_basic(events, terminal_data)
+        analysis = process_transcript_basic(boundary_events, terminal_data)
+        analysis['event_count'] = event_count
+        log_func(f"[LOAD] Loaded {analysis['event_count']} events")
         log_func(f"[ANALYZE] Session: {analysis['session_id']}, Duration: {analysis['duration']:.1f}s")
         if terminal_data:
             log_func(f"[ANALYZE] Terminal recording: {analysis['terminal_text_length']} chars")
+        log_buf.flush()
 
         # Phase 3: LLM processing for pattern detection
         llm_analysis = None
@@ -804,6 +1415,7 @@ def main():
                 log_func(f"[LLM] Found {len(llm_analysis.get('patterns', []))} patterns, {len(llm_analysis.get('decisions', []))} decisions")
             else:
                 log_func("[LLM] Analysis not available, falling back to basic processing")
+        log_buf.flush()
 
         # Phase 3.5: Procedural memory extraction
         if llm_analysis and HAS_PROCEDURAL and workspace:
@@ -865,8 +1477,8 @@ def main():
                 log_func(f"[MEMORY] Created memory file: {memory_file}")
             except Exception as e:
                 log_func(f"[MEMORY] Failed to create memory file: {e}")
-                import traceback
                 log_func(f"[MEMORY] {traceback.format_exc()}")
+        log_buf.flush()
 
         # Phase 5: Project state tracking (if analyzer available)
         if HAS_PROJECT_ANALYZER and llm_analysis:
@@ -888,34 +1500,47 @@ def main():
                 # Save pending updates
                 for update in updates:
                     update_file = analyzer.save_pending_update(update)
-                    log(log_file, f"[PROJECT] Saved pending update: {update_file.name} (confidence: {update.confidence})")
+                    log_func(f"[PROJECT] Saved pending update: {update_file.name} (confidence: {update.confidence})")
 
                 if updates:
-                    log(log_file, f"[PROJECT] Generated {len(updates)} pending project update(s)")
+                    log_func(f"[PROJECT] Generated {len(updates)} pending project update(s)")
                 else:
-                    log(log_file, "[PROJECT] No project state changes detected")
+                    log_func("[PROJECT] No project state changes detected")
 
             except Exception as e:
-                log(log_file, f"[PROJECT] Failed to analyze project state: {e}")
-                import traceback
-                log(log_file, f"[PROJECT] {traceback.format_exc()}")
-
-        # Generate guidance (with LLM insights if available)
-        guidance_file = generate_guidance_basic(cerebrum_path, analysis, llm_analysis, workspace)
-        log_func(f"[GUIDANCE] Generated guidance: {guidance_file}")
-
-        # Finalize session memories (move to cerebrum, update index)
-        if workspace and memory_file:
-            finalized_memories = finalize_session_memories(workspace, cerebrum_path, log_func)
-            if finalized_memories:
-                log_func(f"[FINALIZE] Finalized {len(finalized_memories)} memories to cerebrum")
+                log_func(f"[PROJECT] Failed to analyze project state: {e}")
+                log_func(f"[PROJECT] {traceback.format_exc()}")
 
-        # Move processed transcript to processed directory
+        # Generate guidance, archive the transcript, and finalize session
+        # memories concurrently - the three touch disjoint files, so
+        # overlapping them hides each write behind the others
         processed_dir = cerebrum_path / '.ai' / 'subconscious' / '.ai' / 'processed'
         processed_dir.mkdir(parents=True, exist_ok=True)
         processed_file = processed_dir / transcript_file.name
-        transcript_file.rename(processed_file)
+
+        async def _finalize():
+            loop = asyncio.get_running_loop()
+            tasks = [
+                loop.run_in_executor(
+                    None, generate_guidance_basic,
+                    cerebrum_path, analysis, llm_analysis, workspace
+                ),
+                loop.run_in_executor(None, _archive_transcript, transcript_file, processed_file)
+            ]
+            if workspace and memory_file:
+                tasks.append(loop.run_in_executor(
+                    None, finalize_session_memories,
+                    workspace, cerebrum_path, log_func
+                ))
+            return await asyncio.gather(*tasks)
+
+        finalize_results = asyncio.run(_finalize())
+        guidance_file = finalize_results[0]
+        log_func(f"[GUIDANCE] Generated guidance: {guidance_file}")
         log_func(f"[ARCHIVE] Moved transcript to: {processed_file}")
+        if len(finalize_results) > 2 and finalize_results[2]:
+            log_func(f"[FINALIZE] Finalized {len(finalize_results[2])} memories to cerebrum")
+        log_buf.flush()
 
         # Mark session as complete
         if workspace:
@@ -924,18 +1549,44 @@ def main():
                 'decisions_count': len(llm_analysis.get('decisions', [])) if llm_analysis else 0
             })
 
+        # Record the content hash so duplicate invocations skip early -
+        # but only when the LLM actually analyzed the session. A
+        # basic-stats-only run (LLM unavailable) must stay unrecorded so
+        # the launcher's reprocess command can re-run the archived
+        # transcript once the analyzer is back.
+        if llm_analysis is not None:
+            try:
+                idem_conn = _open_analysis_cache(cerebrum_path)
+                idem_conn.execute(
+                    'CREATE TABLE IF NOT EXISTS processed ('
+                    'hash TEXT PRIMARY KEY, created_at TEXT NOT NULL)'
+                )
+                idem_conn.execute(
+                    'INSERT OR REPLACE INTO processed (hash, created_at) VALUES (?, ?)',
+                    (transcript_hash, datetime.now().isoformat())
+                )
+                idem_conn.commit()
+                idem_conn.close()
+            except sqlite3.Error as e:
+                log_func(f"[WARN] Failed to record processed hash: {e}")
+
         log_func(f"[COMPLETE] Processing complete")
 
     except Exception as e:
         log_func(f"[ERROR] {str(e)}")
-        import traceback
         log_func(f"[ERROR] {traceback.format_exc()}")
         if workspace:
             workspace.mark_failed(str(e))
         # Don't raise - just log and exit gracefully
 
     finally:
-        # Always remove lock
+        # Write out any remaining log lines
+        log_buf.close()
+
+        # Always release and remove lock
+        if lock_fd is not None:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
         if lockfile.exists():
             lockfile.unlink()
 
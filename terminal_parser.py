@@ -5,25 +5,68 @@ Terminal recording parser for samantha-llm subconscious feature.
 Parses raw terminal output to extract conversation content.
 """
 
+import codecs
 import re
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+# Optional Hyperscan bindings - compiles the ANSI patterns to a JIT'd DFA
+# that scans multi-MB recordings several times faster than Python's re
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+_HS_DB = None
+
+# Deletion table for C0 control characters other than newline/tab;
+# str.translate walks the string once in C instead of a per-character
+# Python generator with an ord() call each
+_CTRL_DELETE = {i: None for i in range(32) if i not in (9, 10)}
+
+
+def _get_hyperscan_db():
+    """Compile (once) the Hyperscan database for ANSI sequence matching."""
+    global _HS_DB
+    if _HS_DB is None:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[rb'\x1b\][^\x07]*\x07', rb'\x1b\[[^a-zA-Z]*[a-zA-Z]'],
+            ids=[0, 1],
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 2,
+        )
+    return _HS_DB
+
 
 class TerminalParser:
     """Parse terminal recordings to extract conversation content."""
 
-    # ANSI escape sequence patterns
-    ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;?]*[a-zA-Z]')
-    ANSI_COLOR = re.compile(r'\x1b\[[\d;]+m')
-    ANSI_OSC = re.compile(r'\x1b\][^\x07]*\x07')  # Operating System Command
-    ANSI_CSI = re.compile(r'\x1b\[[^a-zA-Z]*[a-zA-Z]')  # Control Sequence Introducer
+    # ANSI escape sequence pattern: OSC (Operating System Command) and CSI
+    # (Control Sequence Introducer) fused into one alternation so stripping
+    # scans the recording once. The CSI branch subsumes the narrower
+    # color/escape forms (\x1b\[[0-9;?]*[a-zA-Z] and \x1b\[[\d;]+m).
+    ANSI_COMBINED = re.compile(r'\x1b\][^\x07]*\x07|\x1b\[[^a-zA-Z]*[a-zA-Z]')
 
     # Claude Code UI patterns
     SCRIPT_HEADER = re.compile(r'^Script started on.*\[COMMAND=')
     SCRIPT_FOOTER = re.compile(r'^Script done on.*\[COMMAND_EXIT_CODE=')
     CLAUDE_PROMPT = re.compile(r'❯\s+')
 
+    # Metadata extraction patterns, compiled once at class creation
+    # rather than per _extract_metadata call
+    _HEADER_KV = {
+        key: re.compile(rf'{key}="([^"]+)"')
+        for key in ('TERM', 'TTY', 'COLUMNS', 'LINES')
+    }
+    _EXIT_CODE = re.compile(r'COMMAND_EXIT_CODE="(\d+)"')
+    _STATS_PATTERNS = {
+        'total_cost': re.compile(r'Total cost:\s+\$(\d+\.\d+)'),
+        'api_duration': re.compile(r'Total duration \(API\):\s+(.+)'),
+        'wall_duration': re.compile(r'Total duration \(wall\):\s+(.+)'),
+        'code_changes': re.compile(r'Total code changes:\s+(\d+) lines added, (\d+) lines removed')
+    }
+
     def __init__(self):
         """Initialize parser."""
         pass
@@ -38,17 +81,49 @@ class TerminalParser:
         Returns:
             Clean text without ANSI codes
         """
-        # Remove all ANSI sequences
-        text = self.ANSI_OSC.sub('', text)
-        text = self.ANSI_CSI.sub('', text)
-        text = self.ANSI_ESCAPE.sub('', text)
-        text = self.ANSI_COLOR.sub('', text)
+        # Remove all ANSI sequences in a single linear pass
+        text = self.ANSI_COMBINED.sub('', text)
 
         # Remove other control characters except newline/tab
-        text = ''.join(char for char in text if char in '\n\t' or ord(char) >= 32)
+        text = text.translate(_CTRL_DELETE)
 
         return text
 
+    def strip_ansi_bytes(self, data: bytes) -> bytes:
+        """
+        Remove ANSI escape sequences from raw bytes via Hyperscan.
+
+        ANSI sequences are pure ASCII, so stripping them before the UTF-8
+        decode is equivalent to stripping after - and the Hyperscan DFA
+        scans the buffer far faster than the regex engine.
+
+        Args:
+            data: Raw recording bytes
+
+        Returns:
+            Bytes with ANSI sequences removed
+        """
+        spans = []
+        _get_hyperscan_db().scan(
+            data,
+            match_event_handler=lambda _id, start, end, _flags, _ctx:
+                spans.append((start, end))
+        )
+        if not spans:
+            return data
+
+        # Hyperscan can report overlapping spans; merge while slicing out
+        # the kept runs
+        spans.sort()
+        kept = []
+        pos = 0
+        for start, end in spans:
+            if start > pos:
+                kept.append(data[pos:start])
+            pos = max(pos, end)
+        kept.append(data[pos:])
+        return b''.join(kept)
+
     def parse_recording(self, recording_file: Path) -> Dict[str, Any]:
         """
         Parse terminal recording file.
@@ -72,8 +147,45 @@ class TerminalParser:
 
         try:
             # Read recording
-            with open(recording_file, 'r', encoding='utf-8', errors='replace') as f:
-                raw_content = f.read()
+            with open(recording_file, 'rb') as f:
+                raw_bytes = f.read()
+
+            return self.parse_recording_bytes(raw_bytes)
+
+        except Exception as e:
+            return {
+                'raw_text': '',
+                'messages': [],
+                'metadata': {},
+                'error': str(e)
+            }
+
+    def parse_recording_bytes(self, data) -> Dict[str, Any]:
+        """
+        Parse terminal recording content from a bytes-like object.
+
+        Accepts bytes, memoryview, or an mmap'd file, so callers that
+        already hold the recording bytes (or a mapping of them) can skip a
+        second read of the file.
+
+        Args:
+            data: Raw recording bytes (bytes, memoryview, or mmap)
+
+        Returns:
+            Dictionary with parsed content (same shape as parse_recording)
+        """
+        try:
+            # With Hyperscan available, drop ANSI sequences from the raw
+            # bytes before decoding; strip_ansi then only has control
+            # characters left to filter
+            if HAS_HYPERSCAN:
+                data = self.strip_ansi_bytes(
+                    data if isinstance(data, bytes) else bytes(data)
+                )
+
+            # codecs.decode accepts any buffer - no intermediate bytes copy
+            # when handed an mmap or memoryview
+            raw_content = codecs.decode(data, 'utf-8', errors='replace')
 
             # Strip ANSI codes
             clean_text = self.strip_ansi(raw_content)
@@ -108,8 +220,7 @@ class TerminalParser:
             header_line = text[header_match.start():header_match.end() + 200]
 
             # Extract TERM, TTY, COLUMNS, LINES
-            for key in ['TERM', 'TTY', 'COLUMNS', 'LINES']:
-                pattern = re.compile(rf'{key}="([^"]+)"')
+            for key, pattern in self._HEADER_KV.items():
                 match = pattern.search(header_line)
                 if match:
                     metadata[key.lower()] = match.group(1)
@@ -118,19 +229,12 @@ class TerminalParser:
         footer_match = self.SCRIPT_FOOTER.search(text)
         if footer_match:
             footer_line = text[footer_match.start():footer_match.end() + 50]
-            exit_code_match = re.search(r'COMMAND_EXIT_CODE="(\d+)"', footer_line)
+            exit_code_match = self._EXIT_CODE.search(footer_line)
             if exit_code_match:
                 metadata['exit_code'] = exit_code_match.group(1)
 
         # Extract session statistics (Claude Code specific)
-        stats_patterns = {
-            'total_cost': re.compile(r'Total cost:\s+\$(\d+\.\d+)'),
-            'api_duration': re.compile(r'Total duration \(API\):\s+(.+)'),
-            'wall_duration': re.compile(r'Total duration \(wall\):\s+(.+)'),
-            'code_changes': re.compile(r'Total code changes:\s+(\d+) lines added, (\d+) lines removed')
-        }
-
-        for key, pattern in stats_patterns.items():
+        for key, pattern in self._STATS_PATTERNS.items():
             match = pattern.search(text)
             if match:
                 if key == 'code_changes':
@@ -153,36 +257,47 @@ class TerminalParser:
         # This is a placeholder - proper parsing requires understanding
         # the specific agent's output format
 
-        # Skip script header/footer
-        lines = text.split('\n')
-        in_conversation = False
-        current_message = []
+        # Walk lines by offset instead of materializing a full
+        # text.split('\n') list - on multi-MB recordings that list doubles
+        # peak memory. Message content is sliced from the original text in
+        # one allocation per block when its lines are contiguous.
+        spans = []  # (start, end) offsets of lines in the current block
+
+        def flush():
+            if not spans:
+                return
+            start, end = spans[0][0], spans[-1][1]
+            if end - start == sum(e - s for s, e in spans) + len(spans) - 1:
+                # Contiguous lines - a single slice of the source text
+                content = text[start:end]
+            else:
+                # A skipped script-control line split the block
+                content = '\n'.join(text[s:e] for s, e in spans)
+            messages.append({'type': 'unknown', 'content': content})
+            spans.clear()
+
+        pos = 0
+        text_length = len(text)
+        while pos <= text_length:
+            newline = text.find('\n', pos)
+            end = newline if newline != -1 else text_length
+            line = text[pos:end]
 
-        for line in lines:
             # Skip script control lines
             if self.SCRIPT_HEADER.match(line) or self.SCRIPT_FOOTER.match(line):
-                continue
-
-            # Skip empty lines and pure UI elements
-            if not line.strip():
-                if current_message:
-                    # End of message block
-                    messages.append({
-                        'type': 'unknown',
-                        'content': '\n'.join(current_message)
-                    })
-                    current_message = []
-                continue
-
-            # Accumulate message content
-            current_message.append(line)
+                pass
+            # Empty lines and pure UI elements end the current block
+            elif not line.strip():
+                flush()
+            else:
+                spans.append((pos, end))
+
+            if newline == -1:
+                break
+            pos = newline + 1
 
         # Add final message if any
-        if current_message:
-            messages.append({
-                'type': 'unknown',
-                'content': '\n'.join(current_message)
-            })
+        flush()
 
         return messages
 
@@ -210,6 +325,20 @@ def parse_terminal_recording(recording_file: Path) -> Dict[str, Any]:
     return parser.parse_recording(recording_file)
 
 
+def parse_terminal_recording_bytes(data) -> Dict[str, Any]:
+    """
+    Convenience function to parse recording bytes already in memory.
+
+    Args:
+        data: Raw recording bytes (bytes, memoryview, or mmap)
+
+    Returns:
+        Parsed recording data
+    """
+    parser = TerminalParser()
+    return parser.parse_recording_bytes(data)
+
+
 if __name__ == '__main__':
     import sys
 
@@ -5,9 +5,10 @@ Integration tests for session-isolated processing system.
 
 import unittest
 import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from session_workspace import SessionWorkspace, get_active_sessions
+from test_session_workspace import _fast_rmtree
 from bootstrap_status import display_processing_status, get_status_summary
 from merge_sessions import merge_completed_sessions
 
@@ -23,7 +24,7 @@ class TestIntegration(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir)
+        _fast_rmtree(self.temp_dir)
 
     def test_end_to_end_workflow(self):
         """Test complete workflow: create session, process, merge."""
@@ -31,11 +32,12 @@ class TestIntegration(unittest.TestCase):
         session1 = SessionWorkspace('20260205_120000', self.cerebrum_path)
         session1.create()
 
-        # Simulate chunk processing
+        # Simulate chunk processing (batched: one manifest write)
         session1.init_chunk_manifest(3)
-        session1.update_chunk_status(1, 'complete', {'patterns_count': 5})
-        session1.update_chunk_status(2, 'complete', {'patterns_count': 3})
-        session1.update_chunk_status(3, 'complete', {'patterns_count': 4})
+        with session1.batch():
+            session1.update_chunk_status(1, 'complete', {'patterns_count': 5})
+            session1.update_chunk_status(2, 'complete', {'patterns_count': 3})
+            session1.update_chunk_status(3, 'complete', {'patterns_count': 4})
 
         # Create mock guidance
         guidance_content = """---
@@ -98,22 +100,37 @@ This is a test memory from the session.
 
     def test_multiple_sessions(self):
         """Test handling multiple concurrent sessions."""
-        # Create 3 sessions
-        session1 = SessionWorkspace('20260205_120000', self.cerebrum_path)
-        session1.create()
-        session1.init_chunk_manifest(2)
-        session1.update_chunk_status(1, 'complete')
-        session1.update_chunk_status(2, 'failed', {'error': 'timeout'})
-
-        session2 = SessionWorkspace('20260205_130000', self.cerebrum_path)
-        session2.create()
-        session2.init_chunk_manifest(1)
-        session2.update_chunk_status(1, 'complete')
-        session2.mark_complete()
-
-        session3 = SessionWorkspace('20260205_140000', self.cerebrum_path)
-        session3.create()
-        session3.mark_failed('Test error')
+        # Create 3 sessions. Setup is independent per session, so run it
+        # on a thread pool - the GIL releases around each filesystem
+        # syscall, overlapping the metadata-heavy create() calls.
+        def setup_session1():
+            session = SessionWorkspace('20260205_120000', self.cerebrum_path)
+            session.create()
+            session.init_chunk_manifest(2)
+            session.update_chunk_status(1, 'complete')
+            session.update_chunk_status(2, 'failed', {'error': 'timeout'})
+            return session
+
+        def setup_session2():
+            session = SessionWorkspace('20260205_130000', self.cerebrum_path)
+            session.create()
+            session.init_chunk_manifest(1)
+            session.update_chunk_status(1, 'complete')
+            session.mark_complete()
+            return session
+
+        def setup_session3():
+            session = SessionWorkspace('20260205_140000', self.cerebrum_path)
+            session.create()
+            session.mark_failed('Test error')
+            return session
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(setup)
+                for setup in (setup_session1, setup_session2, setup_session3)
+            ]
+            session1, session2, session3 = [f.result() for f in futures]
 
         # Check active sessions
         active = get_active_sessions(self.cerebrum_path)
@@ -132,12 +149,14 @@ This is a test memory from the session.
         # Initialize chunks
         session.init_chunk_manifest(5)
 
-        # Mark some as complete, some as failed
-        session.update_chunk_status(1, 'complete')
-        session.update_chunk_status(2, 'failed', {'error': 'timeout', 'attempts': 1})
-        session.update_chunk_status(3, 'complete')
-        session.update_chunk_status(4, 'failed', {'error': 'timeout', 'attempts': 2})
-        session.update_chunk_status(5, 'processing')
+        # Mark some as complete, some as failed (one batched write)
+        session.batch_update([
+            (1, 'complete', None),
+            (2, 'failed', {'error': 'timeout', 'attempts': 1}),
+            (3, 'complete'),
+            (4, 'failed', {'error': 'timeout', 'attempts': 2}),
+            (5, 'processing'),
+        ])
 
         # Check manifest
         manifest = session.get_chunk_manifest()
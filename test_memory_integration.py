@@ -3,112 +3,103 @@
 Quick test for memory generation with session workspaces.
 """
 
+import mmap
+import os
 import tempfile
 import shutil
+import unittest
 from pathlib import Path
 from session_workspace import SessionWorkspace
 from conversation_analyzer import AnalysisResult
 from memory_generator import generate_memory_file
 
 
-def test_memory_generation_with_workspace():
-    """Test memory generation writes to session workspace."""
-    # Create temp cerebrum
-    temp_dir = tempfile.mkdtemp()
-    cerebrum_path = Path(temp_dir) / 'cerebrum'
-    cerebrum_path.mkdir()
+class TestMemoryGeneration(unittest.TestCase):
+    """Memory generation in workspace and legacy modes."""
+
+    # The analyses are read-only inputs to generate_memory_file, so one
+    # instance per class is enough
+    ANALYSIS = AnalysisResult(
+        patterns=['Test pattern 1', 'Test pattern 2'],
+        decisions=['Test decision: rationale'],
+        todos=['Test TODO'],
+        preferences=['Test preference'],
+        learnings=['Test learning'],
+        summary='Test session summary'
+    )
+    LEGACY_ANALYSIS = AnalysisResult(
+        patterns=['Test pattern'],
+        decisions=['Test decision'],
+        todos=[],
+        preferences=[],
+        learnings=[],
+        summary='Test'
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        """Allocate one temp dir for the whole class."""
+        cls.temp_dir = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temp dir (and every per-test subdir)."""
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Give each test a fresh cerebrum under the shared temp dir."""
+        self.cerebrum_path = (
+            Path(self.temp_dir) / f'case_{self._testMethodName}' / 'cerebrum'
+        )
+        self.cerebrum_path.mkdir(parents=True)
 
-    try:
+    def test_memory_generation_with_workspace(self):
+        """Test memory generation writes to session workspace."""
         # Create session workspace
         session_id = '20260205_120000'
-        workspace = SessionWorkspace(session_id, cerebrum_path)
+        workspace = SessionWorkspace(session_id, self.cerebrum_path)
         workspace.create()
 
-        # Create mock analysis
-        analysis = AnalysisResult(
-            patterns=['Test pattern 1', 'Test pattern 2'],
-            decisions=['Test decision: rationale'],
-            todos=['Test TODO'],
-            preferences=['Test preference'],
-            learnings=['Test learning'],
-            summary='Test session summary'
-        )
-
         # Generate memory file with workspace
         memory_file = generate_memory_file(
-            analysis=analysis,
+            analysis=self.ANALYSIS,
             session_id=session_id,
             workspace=Path('/test/workspace'),
             duration_seconds=900,  # 15 minutes
-            cerebrum_path=cerebrum_path,
+            cerebrum_path=self.cerebrum_path,
             session_workspace=workspace
         )
 
         # Verify memory file is in session workspace
-        assert memory_file.exists(), f"Memory file not created: {memory_file}"
-        assert memory_file.parent == workspace.memories_dir, \
-            f"Memory file in wrong location: {memory_file.parent} != {workspace.memories_dir}"
-
-        # Verify content
-        content = memory_file.read_text()
-        assert 'Test pattern 1' in content, "Pattern not in memory file"
-        assert 'Test decision' in content, "Decision not in memory file"
-        assert session_id in content, "Session ID not in memory file"
-
-        print("✓ Memory file created in session workspace")
-        print(f"  Location: {memory_file}")
-        print(f"  Size: {len(content)} bytes")
-        print()
-        print("✓ All tests passed!")
-
-    finally:
-        shutil.rmtree(temp_dir)
-
-
-def test_memory_generation_legacy():
-    """Test memory generation without workspace (legacy mode)."""
-    # Create temp cerebrum
-    temp_dir = tempfile.mkdtemp()
-    cerebrum_path = Path(temp_dir) / 'cerebrum'
-    cerebrum_path.mkdir()
-
-    try:
-        # Create mock analysis
-        analysis = AnalysisResult(
-            patterns=['Test pattern'],
-            decisions=['Test decision'],
-            todos=[],
-            preferences=[],
-            learnings=[],
-            summary='Test'
-        )
-
+        self.assertTrue(memory_file.exists(), f"Memory file not created: {memory_file}")
+        self.assertEqual(memory_file.parent, workspace.memories_dir)
+
+        # Verify content. The substring checks run against an mmap of
+        # the raw bytes - no UTF-8 decode or full-file str allocation.
+        with open(memory_file, 'rb') as f:
+            self.assertGreater(os.fstat(f.fileno()).st_size, 0)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.assertNotEqual(mm.find(b'Test pattern 1'), -1, "Pattern not in memory file")
+                self.assertNotEqual(mm.find(b'Test decision'), -1, "Decision not in memory file")
+                self.assertNotEqual(mm.find(session_id.encode()), -1, "Session ID not in memory file")
+
+    def test_memory_generation_legacy(self):
+        """Test memory generation without workspace (legacy mode)."""
         # Generate memory file WITHOUT workspace (legacy)
         memory_file = generate_memory_file(
-            analysis=analysis,
+            analysis=self.LEGACY_ANALYSIS,
             session_id='20260205_120000',
             workspace=Path('/test/workspace'),
             duration_seconds=900,
-            cerebrum_path=cerebrum_path,
+            cerebrum_path=self.cerebrum_path,
             session_workspace=None  # No workspace = legacy mode
         )
 
         # Verify memory file is in cerebrum short-term memory
-        expected_dir = cerebrum_path / '.ai' / 'short-term-memory'
-        assert memory_file.exists(), "Memory file not created"
-        assert memory_file.parent == expected_dir, \
-            f"Memory file in wrong location: {memory_file.parent} != {expected_dir}"
-
-        print("✓ Legacy mode: Memory file created in cerebrum")
-        print(f"  Location: {memory_file}")
-        print()
-
-    finally:
-        shutil.rmtree(temp_dir)
+        expected_dir = self.cerebrum_path / '.ai' / 'short-term-memory'
+        self.assertTrue(memory_file.exists(), "Memory file not created")
+        self.assertEqual(memory_file.parent, expected_dir)
 
 
 if __name__ == '__main__':
-    print("Testing memory generation integration...\n")
-    test_memory_generation_with_workspace()
-    test_memory_generation_legacy()
-    print("\n✅ All integration tests passed!")
+    unittest.main(verbosity=2)
@@ -5,11 +5,37 @@ Unit tests for session workspace management.
 
 import unittest
 import json
+import os
 import tempfile
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from session_workspace import SessionWorkspace, get_session_workspaces, get_active_sessions
 
+# Optional in-memory filesystem - when installed, the whole suite runs a
+# second time against it with no real disk I/O (see TestSessionWorkspaceFast)
+try:
+    from pyfakefs import fake_filesystem_unittest
+    HAS_PYFAKEFS = True
+except ImportError:
+    HAS_PYFAKEFS = False
+
+
+def _fast_rmtree(path):
+    """
+    Recursively delete a tree using scandir type information.
+
+    DirEntry.is_dir reads the file type from the directory entry itself,
+    so the walk needs no per-entry stat and no error-handler machinery -
+    test teardown is all freshly-created files with no symlink surprises.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
 
 class TestSessionWorkspace(unittest.TestCase):
     """Test cases for SessionWorkspace class."""
@@ -22,7 +48,7 @@ class TestSessionWorkspace(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary directory."""
-        shutil.rmtree(self.temp_dir)
+        _fast_rmtree(self.temp_dir)
 
     def test_workspace_creation(self):
         """Test creating a session workspace."""
@@ -109,15 +135,17 @@ class TestSessionWorkspace(unittest.TestCase):
 
     def test_get_session_workspaces(self):
         """Test retrieving all session workspaces."""
-        # Create multiple workspaces
-        session1 = SessionWorkspace('20260205_120000', self.cerebrum_path)
-        session1.create()
-
-        session2 = SessionWorkspace('20260205_130000', self.cerebrum_path)
-        session2.create()
-
-        session3 = SessionWorkspace('20260205_140000', self.cerebrum_path)
-        session3.create()
+        # Create multiple workspaces in parallel - the creates are
+        # independent and the GIL releases around each syscall
+        def create_workspace(session_id):
+            workspace = SessionWorkspace(session_id, self.cerebrum_path)
+            workspace.create()
+            return workspace
+
+        session_ids = ['20260205_120000', '20260205_130000', '20260205_140000']
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for future in [executor.submit(create_workspace, sid) for sid in session_ids]:
+                future.result()
 
         # Get all workspaces
         workspaces = get_session_workspaces(self.cerebrum_path)
@@ -161,5 +189,22 @@ class TestSessionWorkspace(unittest.TestCase):
         self.assertEqual(active, [])
 
 
+if HAS_PYFAKEFS:
+    class TestSessionWorkspaceFast(fake_filesystem_unittest.TestCase,
+                                   TestSessionWorkspace):
+        """
+        The TestSessionWorkspace suite on an in-memory filesystem.
+
+        pyfakefs redirects os/pathlib calls to an in-process tree, so
+        every mkdir/open/unlink becomes a dict operation instead of a
+        syscall. The real-disk TestSessionWorkspace above still runs as
+        the on-disk smoke test.
+        """
+
+        def setUp(self):
+            self.setUpPyfakefs()
+            TestSessionWorkspace.setUp(self)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -5,13 +5,104 @@ Transcript capture system for samantha-llm subconscious feature.
 Captures session transcripts in JSONL format for async processing.
 """
 
+import errno
 import json
+import os
 import shutil
 import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
+# Optional fast JSON encoder - orjson serializes straight to bytes in C,
+# cutting most of the per-event CPU cost of record_event
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Events between explicit buffer flushes (see record_event)
+FLUSH_INTERVAL = 128
+
+# Directories already created by this process - mkdir(parents=True) costs
+# a stat/mkdirat per path component even when everything exists, so skip
+# it after the first save to a given cerebrum
+_ensured_dirs = set()
+
+# (source_dir, transcripts_dir) -> whether they share a device. Saves
+# re-statting both sides (and attempting a doomed rename) on every move
+# to the same cerebrum.
+_same_device = {}
+
+# Memoized ISO timestamp, keyed on the integer microsecond. Back-to-back
+# events (tool_use -> tool_result pairs) frequently land on the same
+# clock reading and reuse the whole string; otherwise only the seconds
+# and microseconds are formatted - the date-to-minute prefix is cached
+# and rebuilt via strftime just once per minute.
+_last_ts_key = None
+_last_ts_str = None
+_last_minute = None
+_minute_prefix = ''
+
+
+def _iso_timestamp() -> str:
+    """Return datetime.now().isoformat(), formatted incrementally."""
+    global _last_ts_key, _last_ts_str, _last_minute, _minute_prefix
+    key = time.time_ns() // 1000
+    if key == _last_ts_key:
+        return _last_ts_str
+
+    # Epoch minute boundaries line up with local ones (UTC offsets are
+    # whole minutes), so the prefix only changes when the minute does
+    minute, remainder = divmod(key, 60_000_000)
+    if minute != _last_minute:
+        _minute_prefix = datetime.fromtimestamp(minute * 60).strftime('%Y-%m-%dT%H:%M:')
+        _last_minute = minute
+
+    seconds, micros = divmod(remainder, 1_000_000)
+    if micros:
+        _last_ts_str = f'{_minute_prefix}{seconds:02d}.{micros:06d}'
+    else:
+        # isoformat omits all-zero microseconds
+        _last_ts_str = f'{_minute_prefix}{seconds:02d}'
+    _last_ts_key = key
+    return _last_ts_str
+
+
+if HAS_ORJSON:
+    def _encode_event(event: Dict[str, Any]) -> bytes:
+        return orjson.dumps(event) + b'\n'
+else:
+    # One encoder instance instead of a per-call json.dumps setup.
+    # ensure_ascii=False skips the per-character high-byte escaping pass
+    # (transcripts are full of non-ASCII code and emoji) and compact
+    # separators match what orjson emits.
+    _ENC = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+    def _encode_event(event: Dict[str, Any]) -> bytes:
+        return (_ENC(event) + '\n').encode('utf-8')
+
+
+# Byte templates for the fixed-shape session boundary events - no dict
+# build or full JSON encode, just substitution of the variable fields.
+# Each %b receives an already-JSON-encoded value (see _json_value), so
+# workspace paths with quotes or backslashes stay correctly escaped.
+_SESSION_START_TMPL = (
+    b'{"type":"session_start","timestamp":%b,'
+    b'"metadata":{"agent":%b,"workspace":%b,"session_id":%b}}\n'
+)
+_SESSION_END_TMPL = (
+    b'{"type":"session_end","timestamp":%b,'
+    b'"metadata":{"duration":%b,"session_id":%b}}\n'
+)
+
+
+def _json_value(value) -> bytes:
+    """JSON-encode a single scalar for template substitution."""
+    return json.dumps(value).encode('utf-8')
+
 
 class TranscriptCapture:
     """
@@ -19,31 +110,73 @@ class TranscriptCapture:
 
     Format: Each line is a JSON object with:
         - type: Event type (session_start, user, assistant, tool_use, tool_result, session_end)
-        - content: Event content
+        - content: Event content (omitted when empty)
         - timestamp: ISO8601 timestamp
-        - metadata: Optional metadata dict
+        - metadata: Optional metadata dict (omitted when empty)
     """
 
-    def __init__(self, agent_name: str, workspace: Path):
+    def __init__(self, agent_name: str, workspace: Path, sync: bool = False,
+                 cerebrum_path: Optional[Path] = None):
         """
         Initialize transcript capture.
 
         Args:
             agent_name: Name of the agent (claude, abacus, etc.)
             workspace: Workspace directory path
+            sync: Flush after every event (crash-safety over throughput)
+            cerebrum_path: Optional cerebrum root. On Linux this enables
+                an O_TMPFILE backing file inside the cerebrum transcripts
+                directory: the transcript is an anonymous inode until
+                close() links it into place, so no rename (and no EXDEV
+                copy) is ever needed.
         """
         self.agent_name = agent_name
         self.workspace = workspace
+        self.sync = sync
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._events_since_flush = 0
+        self._anonymous_fd = None
 
-        # Create temp file for transcript
-        self.temp_file = tempfile.NamedTemporaryFile(
-            mode='w',
-            suffix='.jsonl',
-            prefix=f'transcript_{self.session_id}_',
-            delete=False
-        )
-        self.filepath = Path(self.temp_file.name)
+        # Preferred: anonymous O_TMPFILE inode in the final directory
+        if cerebrum_path is not None and hasattr(os, 'O_TMPFILE'):
+            transcripts_dir = os.path.join(
+                str(cerebrum_path), '.ai', 'subconscious', '.ai', 'transcripts'
+            )
+            try:
+                os.makedirs(transcripts_dir, exist_ok=True)
+                fd = os.open(transcripts_dir, os.O_TMPFILE | os.O_RDWR, 0o644)
+            except OSError:
+                # Filesystem without O_TMPFILE support - fall through
+                pass
+            else:
+                self._anonymous_fd = fd
+                self.temp_file = os.fdopen(fd, 'wb', buffering=65536, closefd=True)
+                # The path the inode will get at close(); until then it
+                # has no directory entry
+                self._filepath_str = os.path.join(
+                    transcripts_dir,
+                    f'transcript_{self.session_id}_{os.getpid()}.jsonl'
+                )
+
+        if self._anonymous_fd is None:
+            # Fallback: named temp file with a 64KB write buffer, so
+            # events are batched into large write() calls instead of one
+            # syscall each. mkstemp fds are close-on-exec (PEP 446), so
+            # the transcript doesn't leak into spawned agent processes.
+            fd, temp_name = tempfile.mkstemp(
+                suffix='.jsonl',
+                prefix=f'transcript_{self.session_id}_'
+            )
+            self.temp_file = os.fdopen(fd, 'wb', buffering=65536)
+            # Keep the raw str on the hot path; filepath wraps it in a
+            # Path lazily at the API boundary (pathlib allocates per
+            # operation)
+            self._filepath_str = temp_name
+
+    @property
+    def filepath(self) -> Path:
+        """Path to the transcript temp file."""
+        return Path(self._filepath_str)
 
     def record_event(
         self,
@@ -59,39 +192,47 @@ class TranscriptCapture:
             content: Event content
             metadata: Optional metadata dict
         """
-        event = {
-            'type': event_type,
-            'content': content,
-            'timestamp': datetime.now().isoformat(),
-        }
-
+        # Empty fields are omitted entirely - fewer bytes through the
+        # encoder, the disk, and the downstream parser. No consumer reads
+        # 'content' or 'metadata' unconditionally.
+        event = {'type': event_type, 'timestamp': _iso_timestamp()}
+        if content:
+            event['content'] = content
         if metadata:
             event['metadata'] = metadata
 
-        # Write JSON line
-        self.temp_file.write(json.dumps(event) + '\n')
-        self.temp_file.flush()
+        self._write_line(_encode_event(event))
+
+    def _write_line(self, line: bytes):
+        """
+        Write one encoded event line.
+
+        The buffer drains every FLUSH_INTERVAL events (or immediately in
+        sync mode) rather than on every write - a chatty tool-heavy
+        session is otherwise a flush syscall storm.
+        """
+        self.temp_file.write(line)
+        self._events_since_flush += 1
+        if self.sync or self._events_since_flush >= FLUSH_INTERVAL:
+            self.temp_file.flush()
+            self._events_since_flush = 0
 
     def start_session(self):
         """Record session start event."""
-        self.record_event(
-            'session_start',
-            metadata={
-                'agent': self.agent_name,
-                'workspace': str(self.workspace),
-                'session_id': self.session_id
-            }
-        )
+        self._write_line(_SESSION_START_TMPL % (
+            _json_value(_iso_timestamp()),
+            _json_value(self.agent_name),
+            _json_value(str(self.workspace)),
+            _json_value(self.session_id)
+        ))
 
     def end_session(self, duration_seconds: float):
         """Record session end event."""
-        self.record_event(
-            'session_end',
-            metadata={
-                'duration': duration_seconds,
-                'session_id': self.session_id
-            }
-        )
+        self._write_line(_SESSION_END_TMPL % (
+            _json_value(_iso_timestamp()),
+            _json_value(duration_seconds),
+            _json_value(self.session_id)
+        ))
 
     def close(self) -> Path:
         """
@@ -100,7 +241,21 @@ class TranscriptCapture:
         Returns:
             Path to the transcript file
         """
-        self.temp_file.close()
+        if self._anonymous_fd is not None and not self.temp_file.closed:
+            # Publish the anonymous inode: one link syscall gives it its
+            # directory entry right where the worker expects it
+            self.temp_file.flush()
+            try:
+                os.link(f'/proc/self/fd/{self._anonymous_fd}', self._filepath_str)
+            except OSError:
+                # /proc unavailable - salvage the inode by copying it out
+                os.lseek(self._anonymous_fd, 0, os.SEEK_SET)
+                with os.fdopen(os.dup(self._anonymous_fd), 'rb') as src:
+                    with open(self._filepath_str, 'wb') as dst:
+                        shutil.copyfileobj(src, dst)
+        # close() drains any buffered events
+        if not self.temp_file.closed:
+            self.temp_file.close()
         return self.filepath
 
 
@@ -118,12 +273,51 @@ def save_transcript_to_cerebrum(
     Returns:
         Path to saved transcript in cerebrum
     """
-    # Create transcripts directory
-    transcripts_dir = cerebrum_path / '.ai' / 'subconscious' / '.ai' / 'transcripts'
-    transcripts_dir.mkdir(parents=True, exist_ok=True)
+    # Plain-string path work below: os.path.join + os functions skip the
+    # per-operation Path allocations; only the returned value is a Path.
+    source = str(transcript_file)
+
+    # Create transcripts directory (skipped once known to exist)
+    transcripts_dir = os.path.join(
+        str(cerebrum_path), '.ai', 'subconscious', '.ai', 'transcripts'
+    )
+    if transcripts_dir not in _ensured_dirs:
+        os.makedirs(transcripts_dir, exist_ok=True)
+        _ensured_dirs.add(transcripts_dir)
+
+    target_path = os.path.join(transcripts_dir, os.path.basename(source))
+
+    # When close() published an O_TMPFILE inode, the transcript is
+    # already sitting at its final path - nothing to move (and a copy
+    # from a path onto itself would truncate the file to zero bytes)
+    if source == target_path:
+        return Path(target_path)
+
+    # Move transcript to cerebrum: a single atomic rename when source
+    # and cerebrum share a device, otherwise copy + unlink. The device
+    # comparison is cached per directory pair, so cross-filesystem
+    # setups (tmpfs /tmp) skip the rename attempt that would fail EXDEV.
+    # The copy goes through shutil.copyfile, which uses sendfile on
+    # Linux - the kernel moves the bytes without a user-space buffer loop.
+    source_dir = os.path.dirname(source)
+    cache_key = (source_dir, transcripts_dir)
+    same_device = _same_device.get(cache_key)
+    if same_device is None:
+        same_device = (
+            os.stat(source_dir).st_dev == os.stat(transcripts_dir).st_dev
+        )
+        _same_device[cache_key] = same_device
 
-    # Move transcript to cerebrum (use shutil.move for cross-filesystem support)
-    target_path = transcripts_dir / transcript_file.name
-    shutil.move(str(transcript_file), str(target_path))
+    if same_device:
+        try:
+            os.replace(source, target_path)
+            return Path(target_path)
+        except OSError as e:
+            # Same device but different mounts (bind mounts) still
+            # raises EXDEV - fall through to the copy
+            if e.errno != errno.EXDEV:
+                raise
 
-    return target_path
+    shutil.copyfile(source, target_path)
+    os.unlink(source)
+    return Path(target_path)